@@ -0,0 +1,132 @@
+"""
+Created by: Naysa Maria Manu.
+
+Card animations.
+
+Cards glide to where they are going instead of jumping there: from the
+deck into a hand, from a hand onto the discard pile, and along a row
+when the cards around them come and go. Every animation moves one
+surface from a start to an end position over a set time. The animator is
+stepped by the main loop in fixed steps of time, so animations run at
+the same speed whatever the frame rate, never wait for anything, and
+skip ahead instead of falling behind after a slow frame. An animator
+that is turned off finishes every animation the moment it starts, so a
+game nobody watches pays nothing for them. All times are in
+milliseconds.
+"""
+
+from dataclasses import dataclass
+
+# Length of each step animations are moved on by
+STEP = 1000 / 60
+# Most steps taken at once, after which the animator skips ahead
+MAX_STEPS = 6
+
+
+def ease_out(progress):
+    """Return progress through a move that starts fast and slows down."""
+    return 1 - (1 - progress) ** 3
+
+
+@dataclass
+class Tween:
+    """A surface moving from start to end over duration."""
+
+    # The surface being moved
+    surface: object
+    # Where the surface starts and ends, as (x, y)
+    start: tuple
+    end: tuple
+    # How long the move takes
+    duration: float
+    # Time spent moving so far, below zero while waiting to start
+    elapsed: float = 0.0
+
+    def position(self):
+        """Return where the surface is now."""
+        progress = ease_out(min(max(self.elapsed / self.duration, 0.0), 1.0))
+        return (
+            round(self.start[0] + (self.end[0] - self.start[0]) * progress),
+            round(self.start[1] + (self.end[1] - self.start[1]) * progress),
+        )
+
+    @property
+    def done(self):
+        """Whether the surface has reached its end."""
+        return self.elapsed >= self.duration
+
+
+class Animator:
+    """Moves surfaces in fixed steps of time."""
+
+    def __init__(self, enabled=True, step=STEP, max_steps=MAX_STEPS):
+        """Create an animator with nothing moving."""
+        # Whether animations are shown at all
+        self.enabled = enabled
+        # Length of each step, and most steps taken at once
+        self.step = step
+        self.max_steps = max_steps
+        # Moving surfaces by key, in drawing order
+        self.tweens = {}
+        # Time the animations have been stepped up to
+        self.time = None
+
+    def __contains__(self, key):
+        """Check if the surface for key is moving."""
+        return key in self.tweens
+
+    def __iter__(self):
+        """Iterate over the keys of the moving surfaces."""
+        return iter(self.tweens)
+
+    def is_busy(self):
+        """Check if anything is moving."""
+        return bool(self.tweens)
+
+    def position(self, key):
+        """Return where the surface for key is now, or None if not moving."""
+        tween = self.tweens.get(key)
+        return tween.position() if tween else None
+
+    def move(self, key, surface, start, end, duration, delay=0):
+        """Move surface from start to end over duration, after delay."""
+        if not self.enabled or duration <= 0 or start == end:
+            self.stop(key)
+            return
+        self.tweens[key] = Tween(surface, start, end, duration, -delay)
+
+    def stop(self, key):
+        """Stop moving the surface for key, if it is moving."""
+        self.tweens.pop(key, None)
+
+    def clear(self):
+        """Stop every animation."""
+        self.tweens.clear()
+
+    def hold(self, now):
+        """Keep every animation where it is up to time now."""
+        self.time = now
+
+    def update(self, now):
+        """Step every animation on to time now."""
+        if self.time is None or not self.tweens:
+            # Nothing is moving, so new animations start from now
+            self.time = now
+            return
+        steps = int((now - self.time) // self.step)
+        if steps > self.max_steps:
+            # Skip ahead rather than trying to catch up after a slow frame
+            self.time = now - self.max_steps * self.step
+            steps = self.max_steps
+        for _ in range(steps):
+            self.time += self.step
+            for key, tween in list(self.tweens.items()):
+                tween.elapsed += self.step
+                if tween.done:
+                    self.stop(key)
+
+    def sprites(self):
+        """Return (surface, position) for every moving surface."""
+        return [
+            (tween.surface, tween.position()) for tween in self.tweens.values()
+        ]
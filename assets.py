@@ -0,0 +1,160 @@
+"""
+Created by: Naysa Maria Manu.
+
+Card sprite atlas.
+
+Every card face and the card back are scaled once and packed into a
+single atlas surface, which is saved to disk. Later startups load that
+one file instead of decoding and scaling every card image, for as long
+as the scale and the source images stay the same. The atlas is converted
+to the display's pixel format, and each card is a subsurface of it, so
+drawing a card is a plain copy.
+
+Images are decoded on worker threads by an AssetLoader, which is safe
+because decoding happens in C without the display. Only the conversion
+to the display format is left for the main thread, when an image is
+first needed or once the main loop sees it has finished loading.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+# Folder the baked atlas is kept in
+CACHE_DIR = ".cache"
+# Cards in each row of the atlas
+ATLAS_COLUMNS = 8
+
+
+def scaled_size(surface, scale):
+    """Return the size of surface multiplied by scale."""
+    return (
+        int(surface.get_width() * scale),
+        int(surface.get_height() * scale),
+    )
+
+
+def atlas_key(paths, scale):
+    """Return a key that changes whenever the scale or any source changes."""
+    digest = hashlib.sha1(repr(scale).encode())
+    for name in sorted(paths):
+        stat = os.stat(paths[name])
+        digest.update(f"{name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()[:16]
+
+
+def load_scaled(path, scale):
+    """Load the image at path and scale it."""
+    image = pygame.image.load(path)
+    return pygame.transform.scale(image, scaled_size(image, scale))
+
+
+def build_atlas(paths, scale):
+    """Load, scale and pack the images in paths into one surface."""
+    names = list(paths)
+    # Decode the images side by side on their own threads
+    with ThreadPoolExecutor(thread_name_prefix="atlas") as executor:
+        loaded = executor.map(
+            load_scaled, [paths[name] for name in names], [scale] * len(names)
+        )
+        images = dict(zip(names, loaded, strict=True))
+    cell_width = max(image.get_width() for image in images.values())
+    cell_height = max(image.get_height() for image in images.values())
+    rows = -(-len(images) // ATLAS_COLUMNS)
+
+    atlas = pygame.Surface((cell_width * ATLAS_COLUMNS, cell_height * rows))
+    rects = {}
+    for index, name in enumerate(sorted(images)):
+        row, column = divmod(index, ATLAS_COLUMNS)
+        position = (column * cell_width, row * cell_height)
+        rects[name] = atlas.blit(images[name], position)
+    return atlas, rects
+
+
+def load_atlas(paths, scale):
+    """Return the atlas surface and rects, from disk if it is up to date."""
+    key = atlas_key(paths, scale)
+    image_path = os.path.join(CACHE_DIR, f"card_atlas_{key}.png")
+    index_path = os.path.join(CACHE_DIR, f"card_atlas_{key}.json")
+
+    if os.path.exists(image_path) and os.path.exists(index_path):
+        with open(index_path) as index_file:
+            index = json.load(index_file)
+        if sorted(index) == sorted(paths):
+            rects = {name: pygame.Rect(rect) for name, rect in index.items()}
+            return pygame.image.load(image_path), rects
+
+    atlas, rects = build_atlas(paths, scale)
+    # A missing or read-only cache folder only costs the next startup time
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pygame.image.save(atlas, image_path)
+        with open(index_path, "w") as index_file:
+            json.dump(
+                {name: list(rect) for name, rect in rects.items()}, index_file
+            )
+    except OSError:
+        pass
+    return atlas, rects
+
+
+def card_sprites(atlas, rects):
+    """Return a display-ready surface for each rect of the atlas, by name."""
+    # Convert once so blits don't convert pixel formats every frame
+    atlas = atlas.convert()
+    return {name: atlas.subsurface(rect) for name, rect in rects.items()}
+
+
+def load_card_sprites(paths, scale):
+    """Return a display-ready surface for each image in paths, by name."""
+    return card_sprites(*load_atlas(paths, scale))
+
+
+class AssetLoader:
+    """Loads assets on worker threads and hands them out once ready."""
+
+    def __init__(self, workers=None):
+        """Create a loader with a pool of worker threads."""
+        # Threads that decode images
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="assets"
+        )
+        # Loads still running, as name: (future, finish)
+        self.loading = {}
+        # Finished assets by name
+        self.ready = {}
+
+    def load(self, name, function, *args, finish=None):
+        """Start function(*args) on a worker, finish(result) on first use."""
+        future = self.executor.submit(function, *args)
+        self.loading[name] = (future, finish)
+
+    def load_image(self, name, path):
+        """Start loading the image at path, converted once it is used."""
+        self.load(name, pygame.image.load, path, finish=pygame.Surface.convert)
+
+    def get(self, name):
+        """Return an asset, waiting for it if it is still loading."""
+        if name not in self.ready:
+            future, finish = self.loading.pop(name)
+            result = future.result()
+            self.ready[name] = finish(result) if finish else result
+        return self.ready[name]
+
+    def poll(self):
+        """Finish every asset that has loaded, without waiting."""
+        for name in [
+            name for name, (future, _) in self.loading.items() if future.done()
+        ]:
+            self.get(name)
+
+    def is_loading(self):
+        """Check if any asset is still loading."""
+        return bool(self.loading)
+
+    def shutdown(self):
+        """Stop the worker threads, dropping loads that haven't started."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,68 @@
+"""
+Created by: Naysa Maria Manu.
+
+Least recently used cache.
+
+Keeps things that are slow to make, such as loaded images, rendered text
+and buttons, keyed by what they were made from. When the cache is full
+the entry used longest ago is dropped. Hits and misses are counted so
+it is easy to check that nothing is being made twice.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A bounded cache that drops the least recently used entry."""
+
+    def __init__(self, maxsize=128):
+        """Create an empty cache holding at most maxsize entries."""
+        # Most entries kept at once
+        self.maxsize = maxsize
+        # Entries from least to most recently used
+        self.entries = OrderedDict()
+        # Lookups that found an entry, and lookups that had to make one
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self.entries)
+
+    def __contains__(self, key):
+        """Check if key has an entry, without counting it as a use."""
+        return key in self.entries
+
+    def get(self, key, create):
+        """Return the entry for key, calling create() to make it if needed."""
+        entries = self.entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        value = create()
+        entries[key] = value
+        # Drop the entry used longest ago once the cache is too big
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every entry, keeping the hit and miss counts."""
+        self.entries.clear()
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that found an entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Return a printable summary of how well the cache is doing."""
+        return (
+            f"{self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.1%} hit rate), "
+            f"{len(self)} of {self.maxsize} entries"
+        )
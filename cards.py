@@ -0,0 +1,123 @@
+"""
+Created by: Naysa Maria Manu.
+
+Compact card encoding.
+
+Every card is a small int made from its color and value, and the color,
+value and name of each card are worked out once into lookup tables. The
+engine only ever compares these ints; names like "blue_7", which are the
+keys of the card images, are only needed when a card is drawn on screen.
+"""
+
+from enum import IntEnum
+
+
+class Color(IntEnum):
+    """Card colors, in the order cards are added to a new deck."""
+
+    BLUE = 0
+    RED = 1
+    YELLOW = 2
+    GREEN = 3
+    WILD = 4
+
+
+class Value(IntEnum):
+    """Card values, the number cards use their own number."""
+
+    ZERO = 0
+    ONE = 1
+    TWO = 2
+    THREE = 3
+    FOUR = 4
+    FIVE = 5
+    SIX = 6
+    SEVEN = 7
+    EIGHT = 8
+    NINE = 9
+    DRAW_TWO = 10
+    REVERSE = 11
+    SKIP = 12
+    DRAW_FOUR = 13
+
+
+# Colors that make up the deck
+CARD_COLORS = (Color.BLUE, Color.RED, Color.YELLOW, Color.GREEN)
+# Values that have a number on them
+NUMBER_VALUES = tuple(Value(number) for number in range(10))
+# Colored action cards
+SPECIAL_VALUES = (Value.DRAW_TWO, Value.REVERSE, Value.SKIP)
+# Cards each seat must draw when these are played
+DRAW_PENALTIES = {Value.DRAW_TWO: 2, Value.DRAW_FOUR: 4}
+
+# Names used in card image file names
+COLOR_NAMES = {
+    Color.BLUE: "blue",
+    Color.RED: "red",
+    Color.YELLOW: "yellow",
+    Color.GREEN: "green",
+    Color.WILD: "wild",
+}
+VALUE_NAMES = {value: str(int(value)) for value in NUMBER_VALUES}
+VALUE_NAMES[Value.DRAW_TWO] = "+2"
+VALUE_NAMES[Value.REVERSE] = "rev"
+VALUE_NAMES[Value.SKIP] = "skip"
+VALUE_NAMES[Value.DRAW_FOUR] = "+4"
+
+# Bits used by the value part of a card
+VALUE_BITS = 4
+NUM_CARD_CODES = len(Color) << VALUE_BITS
+
+
+def make_card(color, value):
+    """Return the card with the given color and value."""
+    return (color << VALUE_BITS) | value
+
+
+# Lookup tables indexed by card, None marks unused codes
+CARD_COLOR = [None] * NUM_CARD_CODES
+CARD_VALUE = [None] * NUM_CARD_CODES
+CARD_NAMES = [None] * NUM_CARD_CODES
+for _color in Color:
+    for _value in Value:
+        _card = make_card(_color, _value)
+        CARD_COLOR[_card] = _color
+        CARD_VALUE[_card] = _value
+        CARD_NAMES[_card] = f"{COLOR_NAMES[_color]}_{VALUE_NAMES[_value]}"
+
+# Card number for each name, for turning image keys back into cards
+CARDS_BY_NAME = {
+    name: card for card, name in enumerate(CARD_NAMES) if name is not None
+}
+
+# The only wild card has no color of its own
+WILD_DRAW_FOUR = make_card(Color.WILD, Value.DRAW_FOUR)
+WILD_CARDS = (WILD_DRAW_FOUR,)
+
+
+def card_color(card):
+    """Return the color of a card."""
+    return CARD_COLOR[card]
+
+
+def card_value(card):
+    """Return the value of a card."""
+    return CARD_VALUE[card]
+
+
+def card_name(card):
+    """Return the name of a card, which is also its image key."""
+    return CARD_NAMES[card]
+
+
+def parse_card(name):
+    """Return the card with the given name, such as "blue_7"."""
+    return CARDS_BY_NAME[name]
+
+
+def card_matches_top_card(card, top_card):
+    """Check if a card can be played on top of the discard pile."""
+    return (
+        CARD_COLOR[card] == CARD_COLOR[top_card]
+        or CARD_VALUE[card] == CARD_VALUE[top_card]
+    )
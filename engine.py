@@ -0,0 +1,277 @@
+"""
+Created by: Naysa Maria Manu.
+
+UNO rules engine.
+
+Holds the whole state of one UNO table and applies the rules to it. This
+module never touches pygame, so it can be used by the pygame screens in
+gui.py as well as by simulations, tournaments and the game server, which
+run many games without a display.
+"""
+
+import random
+from collections import namedtuple
+
+from cards import (
+    CARD_COLORS,
+    CARD_VALUE,
+    DRAW_PENALTIES,
+    NUM_CARD_CODES,
+    NUMBER_VALUES,
+    SPECIAL_VALUES,
+    WILD_CARDS,
+    Value,
+    card_matches_top_card,
+    card_name,
+    make_card,
+)
+from piles import Deck, DiscardPile, Hand
+
+# Constants
+NUM_CARDS = 7
+
+# Seats at the table
+PLAYER = 0
+COMPUTER = 1
+NUM_SEATS = 2
+
+# Kinds of move
+PLAY = "play"
+DRAW = "draw"
+
+
+# Moves and events are named tuples rather than dataclasses, as importing
+# dataclasses takes longer than importing the rest of the rules together.
+# A move's kind is PLAY or DRAW, and its card is None when drawing
+class Move(namedtuple("Move", ("kind", "card"), defaults=(None,))):
+    """A single move a seat can make on its turn."""
+
+    __slots__ = ()
+
+
+# The one move that does not depend on a card
+DRAW_MOVE = Move(DRAW)
+# The move that plays each card, made once and shared
+PLAY_MOVES = {card: Move(PLAY, card) for card in range(NUM_CARD_CODES)}
+
+
+# An event's kind says what happened, e.g. "play", "draw", "reverse",
+# "skip", "turn" or "win", its seat is the seat it is about, and its cards
+# are the cards involved, if any
+class Event(namedtuple("Event", ("kind", "seat", "cards"), defaults=((),))):
+    """Something that happened at the table, for views to show."""
+
+    __slots__ = ()
+
+
+def new_deck():
+    """Return a list of every card in an unshuffled deck."""
+    # Number cards of every color come first, then the special cards
+    return [
+        make_card(color, value)
+        for values in (NUMBER_VALUES, SPECIAL_VALUES)
+        for color in CARD_COLORS
+        for value in values
+    ]
+
+
+def first_playable_card(state):
+    """Pick the first playable card in hand, or draw if there is none."""
+    hand = state.hands[state.current]
+    top_card = state.top_card
+    if top_card is None:
+        card = next(iter(hand), None)
+    else:
+        card = hand.first_playable(top_card)
+    return DRAW_MOVE if card is None else PLAY_MOVES[card]
+
+
+class GameState:
+    """The state of one UNO table and the rules that change it."""
+
+    def __init__(self, rng=None):
+        """Create an empty table, using rng for all randomness."""
+        # Random number generator, so that games can be replayed
+        self.rng = rng if rng is not None else random.Random()
+        # Cards left to draw
+        self.deck = Deck(self.rng)
+        # Cards held by each seat
+        self.hands = [Hand() for _ in range(NUM_SEATS)]
+        # Played cards, the top card is at the end
+        self.discard_pile = DiscardPile()
+        # Direction of play
+        self.direction = 1
+        # Seat whose turn it is
+        self.current = PLAYER
+        # Seat that has won, None while the game is running
+        self.winner = None
+        # Number of turns that have been completed
+        self.turns = 0
+        # Goes up by one for every event, so that views following the
+        # events can tell if they missed one
+        self.version = 0
+
+    @property
+    def player_cards(self):
+        """Cards in the player's hand."""
+        return self.hands[PLAYER]
+
+    @property
+    def computer_cards(self):
+        """Cards in the computer's hand."""
+        return self.hands[COMPUTER]
+
+    @property
+    def top_card(self):
+        """The card on top of the discard pile, or None."""
+        return self.discard_pile.top
+
+    @property
+    def is_over(self):
+        """Whether somebody has won the game."""
+        return self.winner is not None
+
+    def shuffle_and_deal(self, first=PLAYER):
+        """Shuffle the deck and deal cards to every seat."""
+        self.deck = Deck(self.rng, new_deck())
+        self.deck.shuffle()
+
+        # Deal 7 cards to each seat
+        for seat in range(NUM_SEATS):
+            self.hands[seat] = Hand(self.deck.draw_many(NUM_CARDS))
+
+        # Set the initial discard pile card
+        while True:
+            self.discard_pile = DiscardPile([self.deck.draw()])
+            if self.discard_pile.top not in WILD_CARDS:
+                break
+
+        self.direction = 1
+        self.current = first
+        self.winner = None
+        self.turns = 0
+        # A deal can't be followed from events, so views must start again
+        self.version += 1
+
+    def next_seat(self, seat):
+        """Return the seat that plays after seat in the current direction."""
+        return (seat + self.direction) % NUM_SEATS
+
+    def can_play(self, card):
+        """Check if card may be played on the current top card."""
+        top_card = self.top_card
+        return top_card is None or card_matches_top_card(card, top_card)
+
+    def legal_moves(self):
+        """Return every move the current seat may make."""
+        if self.is_over:
+            return []
+        hand = self.hands[self.current]
+        top_card = self.top_card
+        cards = hand if top_card is None else hand.playable(top_card)
+        moves = [PLAY_MOVES[card] for card in cards]
+        moves.append(DRAW_MOVE)
+        return moves
+
+    def draw_cards(self, seat, count):
+        """Move up to count cards from the deck to a seat's hand."""
+        drawn = self.deck.draw_many(count)
+        if len(drawn) < count and len(self.discard_pile) > 1:
+            # Shuffle all but the top card of the discard pile back in
+            self.deck.refill(self.discard_pile.take_all_but_top())
+            drawn += self.deck.draw_many(count - len(drawn))
+        self.hands[seat].extend(drawn)
+        return drawn
+
+    def apply(self, move):
+        """Apply a move for the current seat and return what happened."""
+        if self.is_over:
+            raise ValueError("The game is already over.")
+        if move.kind == PLAY:
+            events = self._play(move.card)
+        elif move.kind == DRAW:
+            events = self._draw()
+        else:
+            raise ValueError(f"Unknown move: {move}")
+        self.version += len(events)
+        return events
+
+    def pass_turn(self):
+        """End the current seat's turn without playing."""
+        events = self._end_turn([])
+        self.version += len(events)
+        return events
+
+    def step_computer(self, strategy=first_playable_card):
+        """Let strategy pick a move for the current seat and apply it."""
+        return self.apply(strategy(self))
+
+    def _play(self, card):
+        """Play card from the current seat's hand."""
+        seat = self.current
+        hand = self.hands[seat]
+        if card not in hand:
+            raise ValueError(
+                f"{card_name(card)} is not in the hand of seat {seat}."
+            )
+        if not self.can_play(card):
+            raise ValueError(
+                f"{card_name(card)} cannot be played on "
+                f"{card_name(self.top_card)}."
+            )
+
+        # Move the card from the hand to the discard pile
+        hand.remove(card)
+        self.discard_pile.push(card)
+        events = [Event("play", seat, (card,))]
+
+        # Check if the seat has won
+        if not hand:
+            self.winner = seat
+            self.turns += 1
+            events.append(Event("win", seat))
+            return events
+
+        value = CARD_VALUE[card]
+        if value in DRAW_PENALTIES:
+            # The next seat draws the penalty cards
+            victim = self.next_seat(seat)
+            drawn = self.draw_cards(victim, DRAW_PENALTIES[value])
+            events.append(Event("draw", victim, tuple(drawn)))
+
+        elif value is Value.REVERSE:
+            # Reverse the direction of play
+            self.direction *= -1
+            events.append(Event("reverse", seat))
+            # With two seats, a reverse works like a skip
+            if NUM_SEATS == 2:
+                return self._end_turn(events, skip=True)
+
+        elif value is Value.SKIP:
+            # Skip the next seat's turn
+            events.append(Event("skip", seat))
+            return self._end_turn(events, skip=True)
+
+        return self._end_turn(events)
+
+    def _draw(self):
+        """Draw a card for the current seat."""
+        seat = self.current
+        drawn = self.draw_cards(seat, 1)
+        events = [Event("draw", seat, tuple(drawn))]
+
+        # A drawn card that can be played keeps the turn
+        if drawn and self.can_play(drawn[0]):
+            return events
+
+        return self._end_turn(events)
+
+    def _end_turn(self, events, skip=False):
+        """Hand the turn to the next seat, or the one after if skip."""
+        self.turns += 1
+        seat = self.next_seat(self.current)
+        if skip:
+            seat = self.next_seat(seat)
+        self.current = seat
+        events.append(Event("turn", seat))
+        return events
@@ -0,0 +1,251 @@
+"""
+Created by: Naysa Maria Manu.
+
+Rules engine check.
+
+Plays a few seeded games twice over and checks that every event is the
+same both times, and that no card is lost or made along the way. Checks
+that drawing many cards from a deck at once gives the same cards as
+drawing them one at a time, that the discard pile keeps its cards in the
+order they were played, and that a hand's indexes find the same playable
+cards as looking through every card. Runs a game of endless draws far
+past the interpreter's recursion limit, to check that the turn scheduler
+loops rather than recursing, stops at its turn limit and hands over to a
+person's seat. Then empties the deck of a dealt game, all
+at once and with cards still to draw, and checks that drawing shuffles
+the discard pile back in, leaving its top card where it was. Exits with
+an error if anything differs, so a change that breaks replays, the deck,
+the discard pile, a hand or the scheduler is noticed straight away.
+"""
+
+import argparse
+import random
+import sys
+
+from cards import CARD_COLOR, CARD_COLORS, card_matches_top_card
+from engine import (
+    COMPUTER,
+    DRAW_MOVE,
+    NUM_SEATS,
+    PLAYER,
+    GameState,
+    first_playable_card,
+    new_deck,
+)
+from piles import Deck, DiscardPile, Hand
+from scheduler import TurnScheduler
+from strategies import random_playable_card
+
+# Seeds played by default
+SEEDS = 20
+# Games still running after this many turns are stopped
+MAX_TURNS = 1000
+# Cards drawn once the deck has run out
+REFILL_DRAW = 4
+# Cards left in the deck when it runs out partway through a draw
+REFILL_LEFT = 2
+# Random hands looked through, and most cards in each
+HANDS = 200
+HAND_SIZE = 15
+# Turns of endless drawing, far more than the stack could hold if every
+# turn called the next
+LONG_GAME_TURNS = sys.getrecursionlimit() * 5
+
+
+def count_cards(game):
+    """Return the number of cards in the deck, hands and discard pile."""
+    held = sum(len(hand) for hand in game.hands)
+    return len(game.deck) + len(game.discard_pile) + held
+
+
+def play_recorded(seed):
+    """Play seed, return every event and any turn that lost a card."""
+    events = []
+    lost = []
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal(seed % NUM_SEATS)
+    total = count_cards(game)
+
+    def record(seat, moved):
+        """Keep the events of a move and check no card went missing."""
+        events.extend(moved)
+        if count_cards(game) != total:
+            lost.append(game.turns)
+
+    scheduler = TurnScheduler(game, [random_playable_card] * NUM_SEATS)
+    scheduler.add_listener(record)
+    scheduler.run(max_turns=MAX_TURNS)
+    return events, lost
+
+
+def check_replay(seeds):
+    """Return a problem for each seed that doesn't replay the same way."""
+    problems = []
+    for seed in range(seeds):
+        first, lost = play_recorded(seed)
+        again, _ = play_recorded(seed)
+        if first != again:
+            problems.append(f"seed {seed} plays out differently twice")
+        if lost:
+            problems.append(
+                f"seed {seed} changes the number of cards on turn {lost[0]}"
+            )
+    return problems
+
+
+def check_deck(seed=0):
+    """Return a problem if drawing many cards differs from one at a time."""
+    problems = []
+    cards = new_deck()
+    one_at_a_time = Deck(random.Random(seed), cards)
+    many = Deck(random.Random(seed), cards)
+    one_at_a_time.shuffle()
+    many.shuffle()
+    for count in (0, 1, 7, len(cards)):
+        drawn = [one_at_a_time.draw() for _ in range(count)]
+        # Drawing past the end of the deck gives None one at a time
+        drawn = [card for card in drawn if card is not None]
+        if many.draw_many(count) != drawn:
+            problems.append(f"drawing {count} cards at once gives others")
+    if len(many) or many.draw() is not None:
+        problems.append("an empty deck still gives cards")
+    return problems
+
+
+def check_hands(seed=0):
+    """Return a problem if a hand's indexes disagree with its cards."""
+    rng = random.Random(seed)
+    deck = new_deck()
+    for _ in range(HANDS):
+        cards = rng.sample(deck, rng.randint(0, HAND_SIZE))
+        hand = Hand(cards)
+        # Take some cards out again, so the indexes have to follow
+        for card in rng.sample(cards, len(cards) // 3):
+            hand.remove(card)
+            cards.remove(card)
+        if list(hand) != cards:
+            return ["a hand lost the order its cards were added in"]
+        for color in CARD_COLORS:
+            held = sum(CARD_COLOR[card] == color for card in cards)
+            if hand.count_color(color) != held:
+                return [f"a hand miscounts its {color.name.lower()} cards"]
+        for top_card in deck:
+            playable = [
+                card for card in cards if card_matches_top_card(card, top_card)
+            ]
+            if hand.playable(top_card) != playable:
+                return ["a hand's playable cards differ from its cards"]
+            if hand.first_playable(top_card) != next(iter(playable), None):
+                return ["a hand's first playable card isn't the first"]
+            if hand.has_playable(top_card) != bool(playable):
+                return ["a hand is wrong about having a playable card"]
+    return []
+
+
+def check_discard_pile():
+    """Return a problem if the discard pile loses its order."""
+    cards = new_deck()[:3]
+    pile = DiscardPile()
+    problems = []
+    if pile.top is not None:
+        problems.append("an empty discard pile has a top card")
+    for card in cards:
+        pile.push(card)
+    if pile.top != cards[-1]:
+        problems.append("the last card played isn't on top")
+    if pile.take_all_but_top() != cards[:-1] or list(pile) != cards[-1:]:
+        problems.append("taking the discard pile moved the top card")
+    return problems
+
+
+def check_refill(seed=0, left=0):
+    """Return a problem if a deck with left cards isn't refilled on a draw."""
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal()
+    # Play all but left cards of the deck onto the discard pile, under the
+    # top card
+    top_card = game.top_card
+    still_there = list(game.deck)[:left]
+    played = game.deck.draw_many(len(game.deck) - left)
+    game.discard_pile = DiscardPile([*played, top_card])
+
+    drawn = game.draw_cards(PLAYER, REFILL_DRAW)
+    problems = []
+    if sorted(drawn[:left]) != sorted(still_there):
+        problems.append("the cards left in the deck weren't drawn first")
+    if len(drawn) != REFILL_DRAW:
+        problems.append(
+            f"drew {len(drawn)} cards from a refilled deck, not {REFILL_DRAW}"
+        )
+    if list(game.discard_pile) != [top_card]:
+        problems.append("refilling the deck moved the top card")
+    if len(game.deck) != len(played) + left - len(drawn):
+        problems.append("refilling the deck lost cards")
+    if count_cards(game) != len(new_deck()):
+        problems.append("refilling the deck changed the number of cards")
+
+    # With only the top card left there is nothing to draw
+    game.deck.draw_many(len(game.deck))
+    if game.draw_cards(COMPUTER, 1):
+        problems.append("drew a card with no cards left to draw")
+    return problems
+
+
+def always_draw(state):
+    """Draw every turn, so that the game never ends."""
+    return DRAW_MOVE
+
+
+def check_scheduler(seed=0):
+    """Return a problem if the scheduler recurses or misses a stop."""
+    problems = []
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal()
+    scheduler = TurnScheduler(game, [always_draw] * NUM_SEATS)
+    seen = []
+    scheduler.add_listener(lambda seat, moved: seen.append(seat))
+    try:
+        scheduler.run(max_turns=LONG_GAME_TURNS)
+    except RecursionError:
+        return ["the scheduler recursed instead of looping"]
+    if game.turns != LONG_GAME_TURNS:
+        problems.append(f"the scheduler stopped on turn {game.turns}")
+    if len(seen) != scheduler.moves:
+        problems.append("a listener missed a move")
+
+    # The computer moves until the person's seat is up, then waits
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal(COMPUTER)
+    scheduler = TurnScheduler(game, [None, first_playable_card])
+    scheduler.run()
+    if not game.is_over and game.current != PLAYER:
+        problems.append("the scheduler didn't wait for the person's seat")
+    return problems
+
+
+def main(argv=None):
+    """Run every check and report any that fail."""
+    parser = argparse.ArgumentParser(description="Check the rules engine.")
+    parser.add_argument(
+        "--seeds", type=int, default=SEEDS, help="number of games to play"
+    )
+    args = parser.parse_args(argv)
+
+    problems = (
+        check_replay(args.seeds)
+        + check_deck()
+        + check_discard_pile()
+        + check_hands()
+        + check_scheduler()
+        + check_refill()
+        + check_refill(left=REFILL_LEFT)
+    )
+    for problem in problems:
+        print("FAIL:", problem)
+    if problems:
+        sys.exit(1)
+    print("Seeded games replay exactly and every engine check passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Created by: Naysa Maria Manu.
+
+Fonts and rendered text.
+
+Rendering antialiased text with a TTF font is one of the slowest things
+a frame can do, and the game shows the same few messages and button
+labels over and over. Each font is loaded once, and each piece of text
+is rendered once for its font, size and color. Both are reused from
+bounded caches, as every window size asks for fonts of its own size.
+Known messages can be rendered ahead of time.
+"""
+
+import pygame
+
+from cache import LRUCache
+
+
+class TextCache:
+    """Loads fonts once and keeps the text rendered with them."""
+
+    def __init__(self, maxsize=256, font_maxsize=16):
+        """Create an empty cache holding at most maxsize text surfaces."""
+        # Loaded fonts by (path, size), for the last few sizes used
+        self.fonts = LRUCache(font_maxsize)
+        # Rendered text by (font, text, color). Each font is only loaded
+        # once, so the font stands in for its path and size
+        self.surfaces = LRUCache(maxsize)
+
+    def font(self, path, size):
+        """Return the font at path in size, loading it only once."""
+        return self.fonts.get(
+            (path, size), lambda: pygame.font.Font(path, size)
+        )
+
+    def render(self, text, color, font):
+        """Return text rendered in color with font, rendering it only once."""
+        return self.surfaces.get(
+            (font, text, color), lambda: font.render(text, True, color)
+        )
+
+    def prewarm(self, texts, color, font):
+        """Render each of texts ahead of time so the first use is quick."""
+        for text in texts:
+            self.render(text, color, font)
+
+    def stats(self):
+        """Return a printable summary of how well the cache is doing."""
+        return f"text {self.surfaces.stats()}; fonts {self.fonts.stats()}"
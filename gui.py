@@ -0,0 +1,1194 @@
+"""
+Created by: Naysa Maria Manu.
+
+UNO Card game window.
+
+Everything the player sees and clicks on. Importing this module only
+defines the screens. init() opens the window and starts loading the
+images, and main() runs the game, so the rules and the simulator can be
+used without a display.
+"""
+
+import argparse
+import sys
+import time
+from functools import partial
+
+import pygame
+
+from animation import Animator
+from assets import AssetLoader, card_sprites, load_atlas, load_card_sprites
+from cache import LRUCache
+from cards import (
+    CARD_COLORS,
+    CARD_VALUE,
+    COLOR_NAMES,
+    SPECIAL_VALUES,
+    VALUE_NAMES,
+    Value,
+    card_name,
+)
+from engine import (
+    COMPUTER,
+    DRAW_MOVE,
+    PLAY,
+    PLAYER,
+    GameState,
+    Move,
+    first_playable_card,
+)
+from fonts import TextCache
+from layout import RowLayout
+from render import Layer, Renderer
+from scenes import Scene, SceneManager
+from scheduler import TurnScheduler
+from strategies import STRATEGIES
+from timers import MessageQueue, Pacing, TimerQueue
+
+# Constants
+# Size the screens are laid out for, and the window's starting size
+SCREEN_WIDTH = 960
+SCREEN_HEIGHT = 545
+COLOR_RED = (176, 39, 47)
+FONT_PATH = "Text_features/Font_mont.ttf"
+CARD_FONT_PATH = "Text_features/Comic.ttf"
+HOME_BACKGROUND_IMAGE = "images/home_screen.jpg"
+GAME_BACKGROUND_IMAGE = "images/UNO_bg.jpg"
+CARD_BACK_IMAGE = "images/UNO_card.jpg"
+CARD_SCALE = 0.37
+CARD_SPACING = 10
+REVEAL_BUTTON_SIZE = (270, 60)
+# How far a clicked card is raised before it is played
+RAISE_HEIGHT = 30
+# Time in milliseconds cards take to come from the deck, to land on the
+# discard pile and to slide along a row, and the gap between dealt cards
+DRAW_ANIMATION_TIME = 250
+PLAY_ANIMATION_TIME = 250
+SLIDE_ANIMATION_TIME = 150
+DEAL_ANIMATION_GAP = 60
+# Key of the card flying onto the discard pile
+PLAYED = "played"
+# Most frames drawn in a second
+FPS = 60
+# How often to check on images loading in the background, in milliseconds
+LOADING_CHECK_INTERVAL = 50
+# Most rendered messages and labels kept at once
+TEXT_CACHE_SIZE = 256
+# Most fonts kept at once, a few for each recent window size
+FONT_CACHE_SIZE = 16
+# Most sets of backgrounds and cards kept for recent window sizes
+WINDOW_ASSET_CACHE_SIZE = 12
+# Key that switches between a window and fullscreen
+FULLSCREEN_KEY = pygame.K_F11
+
+# Define the new colors
+BUTTON_COLOR = COLOR_RED
+TEXT_COLOR = (254, 245, 185)
+
+# Card colors and types as used in the image file names
+card_colors = [COLOR_NAMES[color] for color in CARD_COLORS]
+special_cards = [VALUE_NAMES[value] for value in SPECIAL_VALUES]
+
+# The window, filled in by init
+screen = None
+# Draws each frame, redrawing only the parts that changed
+renderer = None
+# Loads images on worker threads while the home screen is shown
+assets = None
+# The home screen image, loaded by init for the first frame
+home_background_source = None
+# Fonts, and every message and label rendered with them
+text_cache = TextCache(TEXT_CACHE_SIZE, FONT_CACHE_SIZE)
+font = None
+font_card = None
+
+# Name of the card back in the card atlas
+CARD_BACK = "back"
+
+# Image file for each card face and the card back
+card_paths = {CARD_BACK: CARD_BACK_IMAGE}
+for color in card_colors:
+    for value in [*map(str, range(10)), *special_cards]:
+        card_paths[f"{color}_{value}"] = f"images/{color}_{value}.jpg"
+
+# Backgrounds and cards scaled for the last few window sizes
+window_assets = LRUCache(maxsize=WINDOW_ASSET_CACHE_SIZE)
+
+# Size of the window, and how much bigger it is than the size laid out for
+screen_width, screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
+ui_scale = 1.0
+
+# Filled in by resize_window for the window's size
+home_background_image = None
+# Filled in by load_and_scale_card_images once the game needs them
+game_background_image = None
+card_images = {}
+scaled_card_back_image = None
+# Where the computer's and the player's cards go, once their size is known
+computer_layout = None
+player_layout = None
+
+
+def scaled(length):
+    """Return a length laid out for SCREEN_WIDTH, sized for the window."""
+    return max(round(length * ui_scale), 1)
+
+
+def place(x, y):
+    """Return a position laid out for SCREEN_WIDTH, moved for the window."""
+    return (
+        round(x * screen_width / SCREEN_WIDTH),
+        round(y * screen_height / SCREEN_HEIGHT),
+    )
+
+
+def fit_to_window(image, size):
+    """Return image stretched to size, or image itself if it already fits."""
+    if image.get_size() == size:
+        return image
+    return pygame.transform.smoothscale(image, size)
+
+
+def scale_cards(card_scale):
+    """Return the card images for card_scale, by name."""
+    if card_scale == CARD_SCALE:
+        return assets.get("cards")
+    # Cards are scaled from the original images, through the atlas cache
+    return load_card_sprites(card_paths, card_scale)
+
+
+# Load and scale card images
+def load_and_scale_card_images():
+    """Take the card images for the window, waiting for any still loading."""
+    global card_images, scaled_card_back_image, game_background_image
+    global computer_layout, player_layout
+    size = (screen_width, screen_height)
+    game_background_image = window_assets.get(
+        ("game", size),
+        lambda: fit_to_window(assets.get("game_background"), size),
+    )
+    # Cards only come in steps of an eighth, so dragging the window's
+    # edge doesn't bake a new atlas for every size it passes through
+    card_scale = CARD_SCALE * max(round(ui_scale * 8), 1) / 8
+    card_images = dict(
+        window_assets.get(
+            ("cards", card_scale), partial(scale_cards, card_scale)
+        )
+    )
+    scaled_card_back_image = card_images.pop(CARD_BACK)
+
+    # Both rows are laid out for the size of the cards
+    card_size = scaled_card_back_image.get_size()
+    spacing = scaled(CARD_SPACING)
+    computer_layout = RowLayout(
+        screen_width, card_size, scaled(20), spacing, spacing
+    )
+    player_layout = RowLayout(
+        screen_width,
+        card_size,
+        screen_height - card_size[1] - scaled(20),
+        spacing,
+        spacing,
+    )
+
+
+class Button:
+    """A class to represent buttons in the game."""
+
+    def __init__(self, text, pos, size, color, text_color, font):
+        """Initialize characteristics of buttons."""
+        # Button text
+        self.text = text
+        # Position of the button
+        self.pos = pos
+        # Size of the button
+        self.size = size
+        # Background color of the button
+        self.color = color
+        # Color of the text
+        self.text_color = text_color
+        # Font
+        self.font = font
+        # rectangle for the button
+        self.rect = pygame.Rect(pos, size)
+        self.rendered_text = text_cache.render(text, self.text_color, font)
+        self.text_rect = self.rendered_text.get_rect(center=self.rect.center)
+        # The whole button drawn once, ready to be copied to the screen
+        self.image = pygame.Surface(size)
+        self.image.fill(self.color)
+        self.image.blit(
+            self.rendered_text,
+            self.rendered_text.get_rect(center=self.image.get_rect().center),
+        )
+
+    def draw(self, surface):
+        """Draws and displays the button on the screen."""
+        surface.blit(self.image, self.rect)
+
+    def sprite(self):
+        """Return the button's image and position for the renderer."""
+        return self.image, self.rect.topleft
+
+    def is_clicked(self, event):
+        """Check if the button is clicked based on the event."""
+        # Check for mouse button down event
+        return (
+            event.type == pygame.MOUSEBUTTONDOWN
+            and event.button == 1
+            and self.rect.collidepoint(event.pos)
+        )
+
+
+# Loaded images and buttons, so no screen makes them twice
+resources = LRUCache(maxsize=128)
+
+
+def load_scaled_image(path, size):
+    """Return the image at path scaled to size, loading it only once."""
+
+    def load():
+        image = pygame.transform.scale(pygame.image.load(path), size)
+        return image.convert()
+
+    return resources.get(("image", path, size), load)
+
+
+def render_text(text, color, text_font=None):
+    """Return text rendered in color, rendering it only once."""
+    return text_cache.render(text, color, text_font or font)
+
+
+def make_button(text, pos, size, color, text_color, button_font=None):
+    """Return a button, making it only once for the same settings."""
+    button_font = button_font or font
+    return resources.get(
+        ("button", text, pos, size, color, text_color, button_font),
+        lambda: Button(text, pos, size, color, text_color, button_font),
+    )
+
+
+def quit_game():
+    """Close the window and exit."""
+    print("Frames:", scenes.stats())
+    print("Resource cache:", resources.stats())
+    print("Text cache:", text_cache.stats())
+    # Don't start loading anything more once the window is closing
+    if assets is not None:
+        assets.shutdown()
+    pygame.quit()
+    sys.exit()
+
+
+def layout_buttons():
+    """Make the buttons for the window's size."""
+    global start_button, instructions_button, exit_button
+    global reveal_button, draw_card_button, play_button
+    reveal_size = (
+        scaled(REVEAL_BUTTON_SIZE[0]),
+        scaled(REVEAL_BUTTON_SIZE[1]),
+    )
+
+    # Start button
+    start_button = make_button(
+        "Start",
+        place(400, 350),
+        (scaled(200), scaled(80)),
+        COLOR_RED,
+        (255, 255, 255),
+    )
+
+    # Instructions button
+    instructions_button = make_button(
+        "Instructions",
+        place(650, 350),
+        (scaled(250), scaled(80)),
+        COLOR_RED,
+        (255, 255, 255),
+    )
+
+    # Exit button
+    exit_button = make_button(
+        "Exit",
+        place(SCREEN_WIDTH - 400, SCREEN_HEIGHT - 90),
+        (scaled(100), scaled(50)),
+        COLOR_RED,
+        (255, 255, 255),
+    )
+
+    # Reveal Cards button
+    reveal_button = make_button(
+        "Reveal Cards",
+        (
+            screen_width // 2 - reveal_size[0] // 2,
+            screen_height // 2 - reveal_size[1] // 2,
+        ),
+        reveal_size,
+        BUTTON_COLOR,
+        TEXT_COLOR,
+    )
+
+    # Draw Card button
+    draw_card_button = make_button(
+        "DRAW CARD",
+        (
+            screen_width - reveal_size[0] - scaled(20),
+            (screen_height - reveal_size[1]) // 2,
+        ),
+        reveal_size,
+        BUTTON_COLOR,
+        TEXT_COLOR,
+    )
+
+    # Play button
+    play_button = make_button(
+        "PLAY",
+        (screen_width - scaled(200), screen_height - scaled(60)),
+        (scaled(100), scaled(50)),
+        COLOR_RED,
+        TEXT_COLOR,
+    )
+
+
+def resize_window():
+    """Lay every screen out again for the window's size."""
+    global screen, screen_width, screen_height, ui_scale
+    global font, home_background_image
+    screen = pygame.display.get_surface()
+    screen_width, screen_height = size = screen.get_size()
+    # Keep everything in proportion, at the size the window fits
+    ui_scale = min(screen_width / SCREEN_WIDTH, screen_height / SCREEN_HEIGHT)
+    font = text_cache.font(FONT_PATH, scaled(40))
+
+    home_background_image = window_assets.get(
+        ("home", size), lambda: fit_to_window(home_background_source, size)
+    )
+    layout_buttons()
+    # Only rescale the cards if the game has already needed them
+    if card_images:
+        load_and_scale_card_images()
+        # Cards already moving are heading for where they were
+        animator.clear()
+        forget_shown_positions(None)
+
+    # Nothing already on screen is in the right place any more
+    renderer.screen = screen
+    renderer.invalidate()
+
+
+def toggle_fullscreen():
+    """Switch between fullscreen and a window."""
+    if screen.get_flags() & pygame.FULLSCREEN:
+        pygame.display.set_mode(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE
+        )
+    else:
+        # Size zero uses the whole of the desktop
+        pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    resize_window()
+
+
+# Game state variables
+# Screens of the game, with the one shown on top
+scenes = SceneManager()
+# Indicates if cards are to be revealed
+reveal_cards = False
+# if the reveal button has been clicked
+reveal_button_clicked = False
+# Rules engine holding the deck, hands, discard pile and direction
+game = None
+# Runs the turns, moving the computer's seat between the player's clicks
+scheduler = None
+# track of the card that has been clicked
+selected_card = None
+# Pauses for the computer's moves, clicked cards and messages
+pacing = Pacing()
+# Callbacks waiting to run, such as the computer's next move
+timers = TimerQueue()
+# Messages shown over the table one after another
+messages = MessageQueue(pacing.message_scale)
+# Whether the computer's next move is already waiting on a timer
+computer_move_pending = False
+# Chooses the computer's moves
+computer_strategy = first_playable_card
+# Moves cards between the deck, the hands and the discard pile
+animator = Animator()
+# Where the cards of each row were last shown, by card, or None to show
+# the next layout without animating to it
+player_positions_shown = {}
+computer_positions_shown = {}
+# The card shown on the discard pile, which changes once a card lands
+discard_shown = None
+# The card that was raised when the table was last shown
+raised_card_shown = None
+
+
+def new_game():
+    """Set up an empty table for a new game."""
+    global game, scheduler, selected_card, computer_move_pending
+    game = GameState()
+    # The player's seat is moved by clicks, the computer's by its strategy
+    scheduler = TurnScheduler(game, [None, computer_strategy])
+    # Forget anything still waiting from the last game
+    timers.clear()
+    messages.clear()
+    selected_card = None
+    computer_move_pending = False
+    # Every card of the new game is dealt from the deck
+    animator.clear()
+    forget_shown_positions({})
+
+
+def forget_shown_positions(positions):
+    """Treat both rows as having shown positions, before the next frame."""
+    global player_positions_shown, computer_positions_shown, discard_shown
+    player_positions_shown = positions
+    computer_positions_shown = positions
+    discard_shown = None
+
+
+def set_pacing(new_pacing):
+    """Change how long the game pauses for the computer and messages."""
+    global pacing
+    pacing = new_pacing
+    messages.scale = pacing.message_scale
+    animator.enabled = pacing.animation_scale > 0
+
+
+def animation_time(duration):
+    """Return duration in milliseconds at the current pacing."""
+    return duration * pacing.animation_scale
+
+
+def draw_home_screen():
+    """Draw the home screen with all buttons."""
+    sprites = [
+        start_button.sprite(),
+        instructions_button.sprite(),
+        exit_button.sprite(),
+    ]
+    # Let the player know the cards are still on their way
+    if assets.is_loading():
+        sprites.append(
+            (render_message("Loading cards..."), (scaled(20), scaled(20)))
+        )
+    renderer.draw(home_background_image, sprites)
+
+
+def draw_card_from_deck():
+    """Draw one card from the deck and add it to the player's hand."""
+    if game.is_over or game.current != PLAYER:
+        return
+
+    events = scheduler.apply(DRAW_MOVE)
+    for card in events[0].cards:
+        print(f"Drawn card: {card_name(card)}")
+
+    # A card that doesn't match hands the turn to the computer
+    if game.current == COMPUTER:
+        display_message("Card doesn't match! Computer's turn.", 2000)
+
+
+def display_instructions():
+    """Show the instructions over the current screen."""
+    scenes.push(InstructionsScene())
+
+
+def start_game():
+    """Deal a new game and show the table."""
+    shuffle_and_deal()
+    scenes.replace(GameScene())
+
+
+def return_to_menu():
+    """Reset the table and go back to the home screen."""
+    global reveal_cards, reveal_button_clicked
+    new_game()
+    reveal_cards = False
+    reveal_button_clicked = False
+    scenes.replace(HomeScene())
+
+
+def get_card_at_position(x, y):
+    """Check if the mouse position is over a card and return the card key."""
+    # No clicks are taken while a card is raised, so every card is in the row
+    return player_layout.update(game.player_cards).card_at(x, y)
+
+
+def play_card(card_key):
+    """Handle the action of playing a card from the player's hand."""
+    global selected_card
+    # Deselect the card, whether or not it can be played
+    selected_card = None
+    # Check if the selected card is in the player's hand
+    if card_key in game.player_cards and game.current == PLAYER:
+        print(f"Attempting to play card: {card_name(card_key)}")
+
+        # Check if the card can be played
+        if not game.can_play(card_key):
+            # If the card cannot be played
+            display_message("Wrong selection! Lost your chance", 2000)
+            scheduler.pass_turn()
+            return
+
+        # Move the card from player's hand to the discard pile
+        events = scheduler.apply(Move(PLAY, card_key))
+        print(f"Player played: {card_name(card_key)}")
+        show_events(events)
+
+        # Check if the player has won
+        if game.winner == PLAYER:
+            print("Player has no more cards. Player won the game!")
+
+
+def handle_play_click(x, y, now):
+    """Draw or play a card for a click on the game screen."""
+    global selected_card
+    # Ignore clicks while a message covers the table or a card is on its way
+    if (
+        not messages.is_idle()
+        or selected_card is not None
+        or animator.is_busy()
+    ):
+        return
+    if draw_card_button.rect.collidepoint(x, y):
+        draw_card_from_deck()
+    else:
+        card_key = get_card_at_position(x, y)
+        if card_key is not None and reveal_cards:
+            # Keep the card raised for a moment before it is played
+            selected_card = card_key
+            x, y = dict(player_layout.positions())[card_key]
+            animator.move(
+                ("player", card_key),
+                card_images[card_name(card_key)],
+                (x, y),
+                (x, y - scaled(RAISE_HEIGHT)),
+                animation_time(pacing.play_delay),
+            )
+            timers.schedule(
+                now, pacing.play_delay, partial(play_card, card_key)
+            )
+
+
+# Every message the game can show, rendered ahead of time
+GAME_MESSAGES = (
+    "Loading cards...",
+    "Card doesn't match! Computer's turn.",
+    "Wrong selection! Lost your chance",
+    "Computer played +2 card! You drew 2 cards.",
+    "Computer played +4 card!",
+    "Computer drew 2 cards!",
+    "Computer drew 4 cards!",
+    "Reverse card played!",
+    "Computer played Reverse card!",
+    "Skip card played!",
+    "Computer played Skip card!",
+    "Your turn!",
+    "YOU WON!",
+    "YOU LOST!",
+    "Game Over",
+)
+
+
+def event_message(event):
+    """Return the message and duration to show for an event, or None."""
+    if event.kind == "play" and event.seat == COMPUTER:
+        value = CARD_VALUE[event.cards[0]]
+        if value is Value.DRAW_TWO:
+            return "Computer played +2 card! You drew 2 cards.", 1000
+        if value is Value.DRAW_FOUR:
+            return "Computer played +4 card!", 2000
+    elif event.kind == "draw" and event.seat == COMPUTER:
+        # Only penalty draws are announced
+        if len(event.cards) > 1:
+            return f"Computer drew {len(event.cards)} cards!", 1000
+    elif event.kind == "reverse":
+        if event.seat == PLAYER:
+            return "Reverse card played!", 1000
+        return "Computer played Reverse card!", 1000
+    elif event.kind == "skip":
+        if event.seat == PLAYER:
+            return "Skip card played!", 1000
+        return "Computer played Skip card!", 1000
+    return None
+
+
+def show_events(events):
+    """Display a message for each event that has one."""
+    for event in events:
+        message = event_message(event)
+        if message:
+            display_message(*message)
+
+
+def display_message(message, duration):
+    """Queue a message to be shown for a specified duration."""
+    messages.show(message, duration)
+
+
+def render_message(message):
+    """Render a message once, so each frame reuses the same surface."""
+    return render_text(message, COLOR_RED)
+
+
+def draw_message(message):
+    """Draw a message over the game background."""
+    text = render_message(message)
+    text_rect = text.get_rect(center=(screen_width // 2, screen_height // 2))
+    renderer.draw(game_background_image, [(text, text_rect.topleft)])
+
+
+def shuffle_and_deal():
+    """Shuffle the deck and deal cards to the player and computer."""
+    # The game screen can't be drawn until its images have loaded
+    load_and_scale_card_images()
+    game.shuffle_and_deal()
+
+    # Print the initial state for debugging
+    print("Deck:", [card_name(card) for card in game.deck])
+    print("Player Cards:", [card_name(card) for card in game.player_cards])
+    print("Computer Cards:", [card_name(card) for card in game.computer_cards])
+    print("Discard Pile:", [card_name(card) for card in game.discard_pile])
+
+
+def computer_turn():
+    """Make the computer's next move."""
+    global computer_move_pending
+    computer_move_pending = False
+    if not scheduler.computer_to_move():
+        return
+
+    events = scheduler.step()
+    for event in events:
+        if event.kind == "play":
+            print(f"Computer played: {card_name(event.cards[0])}")
+        elif event.kind == "draw" and event.seat == COMPUTER:
+            print("Computer drew:", [card_name(card) for card in event.cards])
+    show_events(events)
+
+    # Drawing a card that can't be played ends the computer's turn
+    if events[0].kind == "draw" and game.current == PLAYER:
+        print("Computer didn't find a matching card.")
+        display_message("Your turn!", 1000)
+
+
+def update_game(now):
+    """Run due timers, then let the computer move or end the game."""
+    global computer_move_pending
+    timers.update(now)
+    messages.update(now)
+    # Cards only move while the table can be seen
+    if messages.current is None:
+        animator.update(now)
+    else:
+        animator.hold(now)
+
+    # Nothing else happens until every message has been shown and every
+    # card has landed
+    if not messages.is_idle() or animator.is_busy():
+        return
+    if game.is_over:
+        end_game("YOU WON!" if game.winner == PLAYER else "YOU LOST!")
+    elif scheduler.computer_to_move() and not computer_move_pending:
+        # Give the computer time to think before its move
+        computer_move_pending = True
+        timers.schedule(now, pacing.ai_delay, computer_turn)
+
+
+def end_game(message):
+    """Display the end game screen."""
+    scenes.replace(EndScene(message))
+
+
+# Parts of the game screen drawn once and kept until what they show changes
+table_layer = Layer()
+computer_row_layer = Layer()
+player_row_layer = Layer()
+
+
+def table_sprites():
+    """Return the buttons drawn over the game background."""
+    # Draw the Reveal Cards button if not clicked
+    if not reveal_button_clicked:
+        return [reveal_button.sprite()]
+    return [draw_card_button.sprite()]
+
+
+def moving_cards(side):
+    """Return the keys of side's cards that are moving, to key its row on."""
+    return frozenset(key for key in animator if key[0] == side)
+
+
+def computer_row_sprites():
+    """Return the computer's cards that aren't moving, face down in a row."""
+    return [
+        (scaled_card_back_image, position)
+        for index, position in computer_layout.positions()
+        if ("computer", index) not in animator
+    ]
+
+
+def player_row_sprites():
+    """Return the player's cards that aren't moving, in a row."""
+    sprites = []
+    for card_key, (x, y) in player_layout.positions():
+        if ("player", card_key) in animator:
+            continue
+        if reveal_cards:
+            if card_key == selected_card:
+                # Move selected card up by 30 pixels, at the window's scale
+                y -= scaled(RAISE_HEIGHT)
+            sprites.append((card_images[card_name(card_key)], (x, y)))
+        else:
+            sprites.append((scaled_card_back_image, (x, y)))
+    return sprites
+
+
+def player_card_image(card):
+    """Return how one of the player's cards looks."""
+    if reveal_cards:
+        return card_images[card_name(card)]
+    return scaled_card_back_image
+
+
+def computer_card_image(index):
+    """Return how one of the computer's cards looks."""
+    return scaled_card_back_image
+
+
+def deck_position():
+    """Return where cards leave the deck, at the Draw Card button."""
+    rect = draw_card_button.rect
+    return (rect.x, rect.centery - scaled_card_back_image.get_height() // 2)
+
+
+def discard_position():
+    """Return where the top card of the discard pile is drawn."""
+    card_width, card_height = scaled_card_back_image.get_size()
+    return (
+        screen_width // 2 - card_width // 2,
+        screen_height // 2 - card_height // 2,
+    )
+
+
+def animate_row(side, shown, positions, image):
+    """Move a row's cards from where they were shown to where they go."""
+    if positions == shown:
+        return
+    # Cards new to the row come from the deck, one after another
+    arrived = 0
+    gap = 0 if len(positions) - len(shown) <= 1 else DEAL_ANIMATION_GAP
+    for card, position in positions.items():
+        key = (side, card)
+        if card in shown:
+            if shown[card] != position:
+                # Slide on from wherever the card has got to
+                start = animator.position(key) or shown[card]
+                animator.move(
+                    key,
+                    image(card),
+                    start,
+                    position,
+                    animation_time(SLIDE_ANIMATION_TIME),
+                )
+        else:
+            animator.move(
+                key,
+                image(card),
+                deck_position(),
+                position,
+                animation_time(DRAW_ANIMATION_TIME),
+                animation_time(gap * arrived),
+            )
+            arrived += 1
+
+
+def animate_play(start, card):
+    """Fly a card from start onto the discard pile."""
+    animator.move(
+        PLAYED,
+        card_images[card_name(card)],
+        start,
+        discard_position(),
+        animation_time(PLAY_ANIMATION_TIME),
+    )
+
+
+def animate_rows():
+    """Start moving the cards whose place on the table has changed."""
+    global player_positions_shown, computer_positions_shown
+    global discard_shown, raised_card_shown
+    player = dict(player_layout.update(game.player_cards).positions())
+    computer = dict(
+        computer_layout.update(range(len(game.computer_cards))).positions()
+    )
+    player_shown = player_positions_shown
+    computer_shown = computer_positions_shown
+    # After a resize the cards are simply shown where they now go
+    if player_shown is None:
+        player_shown, computer_shown = player, computer
+
+    # A card that left the player's hand and is on top was played
+    played = False
+    for card in player_shown.keys() - player.keys():
+        start = animator.position(("player", card))
+        animator.stop(("player", card))
+        if card == game.top_card:
+            if start is None:
+                x, y = player_shown[card]
+                # A raised card leaves from where it was raised to
+                if card == raised_card_shown:
+                    y -= scaled(RAISE_HEIGHT)
+                start = (x, y)
+            animate_play(start, card)
+            played = True
+
+    # Otherwise the computer's last card flies off when it plays one
+    if (
+        not played
+        and len(computer) < len(computer_shown)
+        and game.top_card != discard_shown
+    ):
+        animate_play(computer_shown[len(computer_shown) - 1], game.top_card)
+    for index in computer_shown.keys() - computer.keys():
+        animator.stop(("computer", index))
+
+    animate_row("player", player_shown, player, player_card_image)
+    animate_row("computer", computer_shown, computer, computer_card_image)
+    player_positions_shown = player
+    computer_positions_shown = computer
+    raised_card_shown = selected_card
+    # The discard pile shows the new card once it has landed
+    if PLAYED not in animator:
+        discard_shown = game.top_card
+
+
+def play_game():
+    """Display the game screen with cards and other UI elements."""
+    # A message covers the whole table while it is shown
+    if messages.current is not None:
+        draw_message(messages.current)
+        return
+
+    # The background and the button bar only change once cards are revealed
+    table, _ = table_layer.get(
+        (
+            game_background_image,
+            reveal_button_clicked,
+            reveal_button,
+            draw_card_button,
+        ),
+        game_background_image,
+        table_sprites,
+        screen.get_rect(),
+    )
+    # Everything drawn over the table, in drawing order
+    sprites = []
+
+    # Start moving any card whose place has changed since the last frame.
+    # Moving cards are left out of the rows until they land
+    animate_rows()
+    # The computer's row only changes when its number of cards does, or
+    # when one of its own cards starts or stops moving
+    computer_row = computer_row_layer.get(
+        (table, len(game.computer_cards), moving_cards("computer")),
+        table,
+        computer_row_sprites,
+    )
+    # The player's row changes with the hand, the reveal, the selection
+    # and which of its own cards are moving
+    player_row = player_row_layer.get(
+        (
+            table,
+            tuple(game.player_cards),
+            reveal_cards,
+            selected_card,
+            moving_cards("player"),
+        ),
+        table,
+        player_row_sprites,
+    )
+    sprites.extend(row for row in (computer_row, player_row) if row)
+
+    # Draw discard pile
+    if reveal_button_clicked and discard_shown is not None:
+        # Top card on discard pile, once it has landed
+        sprites.append(
+            (card_images[card_name(discard_shown)], discard_position())
+        )
+
+    # Only the moving cards are drawn on their own, over everything else
+    sprites.extend(animator.sprites())
+    renderer.draw(table, sprites)
+
+
+class HomeScene(Scene):
+    """The home screen, with the Start, Instructions and Exit buttons."""
+
+    def handle_event(self, event, now):
+        """Start the game, show the instructions or exit."""
+        if start_button.is_clicked(event) or play_button.is_clicked(event):
+            start_game()
+        elif instructions_button.is_clicked(event):
+            display_instructions()
+        elif exit_button.is_clicked(event):
+            quit_game()
+
+    def render(self):
+        """Draw the home screen."""
+        draw_home_screen()
+
+    def time_until_update(self, now):
+        """Check back on the cards while they are still loading."""
+        return LOADING_CHECK_INTERVAL if assets.is_loading() else None
+
+
+class InstructionsScene(Scene):
+    """The instructions, shown over another screen."""
+
+    def handle_event(self, event, now):
+        """Go back on a key press, or start the game from the Play button."""
+        if event.type == pygame.KEYDOWN and event.key != FULLSCREEN_KEY:
+            scenes.pop()
+        elif start_button.is_clicked(event) or play_button.is_clicked(event):
+            start_game()
+
+    def render(self):
+        """Draw the instructions image with the 'Shuffle and Play' button."""
+        # Load the instructions image, resized to fit the screen
+        instructions_image = load_scaled_image(
+            "images/instructions.jpg", (screen_width, screen_height)
+        )
+        renderer.draw(instructions_image, [play_button.sprite()])
+
+
+class GameScene(Scene):
+    """The table, while a game is being played."""
+
+    def handle_event(self, event, now):
+        """Play or draw a card, or reveal the player's cards."""
+        global reveal_cards, reveal_button_clicked
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            handle_play_click(*event.pos, now)
+
+        if reveal_button.is_clicked(event):
+            reveal_cards = True
+            reveal_button_clicked = True
+
+    def update(self, now):
+        """After the player serves, give control to the computer."""
+        update_game(now)
+
+    def render(self):
+        """Draw the table."""
+        play_game()
+
+    def time_until_update(self, now):
+        """Return milliseconds until the game next changes by itself."""
+        # While a message is up nothing happens until it comes off screen,
+        # so only an empty table can have things ready to happen now
+        if messages.current is None:
+            # The next message goes up, or the cards move on
+            if messages.waiting or animator.is_busy():
+                return 0
+            # Once the table is still the game ends or the computer moves
+            if game.is_over or (
+                scheduler.computer_to_move() and not computer_move_pending
+            ):
+                return 0
+
+        # The soonest of the current message and any waiting timer
+        due = [
+            time
+            for time in (messages.next_change(), timers.next_due())
+            if time is not None
+        ]
+        if not due:
+            return None
+        return max(min(due) - now, 0)
+
+
+class EndScene(Scene):
+    """The end of a game, with who won and the Exit and Main Menu buttons."""
+
+    def __init__(self, message):
+        """Create the end screen showing message."""
+        # Who won the game
+        self.message = message
+
+    def buttons(self):
+        """Return the Exit and Main Menu buttons for the window's size."""
+        exit_button = make_button(
+            "Exit",
+            (
+                screen_width // 2 - scaled(150),
+                screen_height // 2 + scaled(60),
+            ),
+            (scaled(100), scaled(50)),
+            COLOR_RED,
+            (255, 255, 255),
+        )
+        menu_button = make_button(
+            "Main Menu",
+            (screen_width // 2 + scaled(50), screen_height // 2 + scaled(60)),
+            (scaled(200), scaled(50)),
+            COLOR_RED,
+            (255, 255, 255),
+        )
+        return exit_button, menu_button
+
+    def handle_event(self, event, now):
+        """Exit, go back to the home screen or show the instructions."""
+        exit_button, menu_button = self.buttons()
+        if exit_button.is_clicked(event):
+            quit_game()
+        if menu_button.is_clicked(event):
+            # Reset to the home screen
+            return_to_menu()
+        elif instructions_button.is_clicked(event):
+            display_instructions()
+
+    def render(self):
+        """Draw the message and the buttons over the game background."""
+        text = render_text(self.message, COLOR_RED)
+        text_rect = text.get_rect(
+            center=(screen_width // 2, screen_height // 2)
+        )
+        sprites = [(text, text_rect.topleft)]
+        sprites.extend(button.sprite() for button in self.buttons())
+        renderer.draw(game_background_image, sprites)
+
+
+def wait_for_events():
+    """Return waiting events, sleeping until one arrives if nothing is due."""
+    events = pygame.event.get()
+    if events:
+        return events
+
+    timeout = scenes.time_until_update(pygame.time.get_ticks())
+    if timeout == 0:
+        return events
+    if timeout is None:
+        # Nothing will change until the player does something
+        event = pygame.event.wait()
+    else:
+        event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event, *pygame.event.get()]
+
+
+def init():
+    """Open the window and start loading everything the game shows."""
+    global screen, renderer, assets, home_background_source
+    global font, font_card
+    # Initialize Pygame
+    pygame.init()
+
+    # Create the screen, which the player can resize
+    screen = pygame.display.set_mode(
+        (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE
+    )
+    pygame.display.set_caption("Uno Game")
+    renderer = Renderer(screen)
+    assets = AssetLoader()
+
+    # The home screen and its buttons are needed for the first frame
+    home_background_source = pygame.image.load(HOME_BACKGROUND_IMAGE).convert()
+    font = text_cache.font(FONT_PATH, 40)
+    font_card = text_cache.font(CARD_FONT_PATH, 60)
+
+    # Everything only the game screen needs loads in the background. Every
+    # card comes from one atlas, baked once for CARD_SCALE
+    assets.load_image("game_background", GAME_BACKGROUND_IMAGE)
+    assets.load(
+        "cards",
+        load_atlas,
+        card_paths,
+        CARD_SCALE,
+        finish=lambda atlas: card_sprites(*atlas),
+    )
+
+    # Lay out the window for its starting size, with an empty table
+    resize_window()
+    new_game()
+
+
+def main(argv=None, started_at=None):
+    """Run the game window's main loop."""
+    global computer_strategy
+    # main.py passes when it started, before anything was imported, so the
+    # time to the first frame includes importing pygame and the rest
+    if started_at is None:
+        started_at = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Play UNO.")
+    parser.add_argument(
+        "--pace",
+        type=float,
+        default=1.0,
+        help="multiplier for every pause in the game, 0 for none",
+    )
+    parser.add_argument(
+        "--fullscreen",
+        action="store_true",
+        help="start in fullscreen, F11 switches back and forth",
+    )
+    parser.add_argument(
+        "--ai",
+        choices=sorted(STRATEGIES),
+        default="first",
+        help="strategy the computer plays with",
+    )
+    args = parser.parse_args(argv)
+    computer_strategy = STRATEGIES[args.ai]
+    init()
+    set_pacing(Pacing().scaled(args.pace))
+    if args.fullscreen:
+        toggle_fullscreen()
+
+    # Show the home screen straight away, while the rest loads
+    scenes.replace(HomeScene())
+    scenes.top.render()
+    first_frame_ms = (time.perf_counter() - started_at) * 1000
+    print(f"Time to first frame: {first_frame_ms:.0f} ms")
+    # Render the messages now, so none stalls the frame it first appears in
+    text_cache.prewarm(GAME_MESSAGES, COLOR_RED, font)
+
+    # Only queue the events that something responds to, so that moving
+    # the mouse doesn't wake the loop up
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [
+            pygame.QUIT,
+            pygame.KEYDOWN,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.VIDEORESIZE,
+            pygame.WINDOWEXPOSED,
+        ]
+    )
+
+    # Limits how fast the loop runs while something is moving
+    clock = pygame.time.Clock()
+    while True:
+        events = wait_for_events()
+        now = pygame.time.get_ticks()
+        # Take in any images that finished loading in the background
+        assets.poll()
+        for event in events:
+            if event.type == pygame.QUIT:
+                quit_game()
+            # Lay the screens out again whenever the window changes size
+            if event.type == pygame.VIDEORESIZE:
+                resize_window()
+            elif event.type == pygame.KEYDOWN and event.key == FULLSCREEN_KEY:
+                toggle_fullscreen()
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Another window covered this one, so draw it all again
+                renderer.invalidate()
+
+        scenes.run_frame(events, now)
+        clock.tick(FPS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Created by: Naysa Maria Manu.
+
+Import time benchmark.
+
+Imports each module in a fresh interpreter several times and takes the
+median time. The rules must import quickly and without pygame, as every
+simulator worker and server table is built on them, so they are held to
+a tight budget. The simulator, the other headless modules and the
+command line entry point must not import pygame either, and are given a
+looser budget. The game server must not import pygame, but needs
+asyncio, so it isn't held to a time. The window module may import
+pygame, but must not start it or open a window until it is asked to.
+Exits with an error if any of this stops being true, so a slow or heavy
+import is noticed as soon as it is added.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# The rules, which must import very quickly and without pygame
+RULES_MODULES = ("cards", "piles", "engine", "scheduler")
+# Other modules that must import quickly and without pygame
+HEADLESS_MODULES = RULES_MODULES + (
+    "strategies",
+    "search",
+    "timers",
+    "cache",
+    "layout",
+    "animation",
+    "scenes",
+    "simulate",
+    "tournament",
+    "protocol",
+    "sync",
+    "main",
+)
+# Modules that must not import pygame, but need asyncio, which on its own
+# takes most of the budget to import
+SERVER_MODULES = ("server", "loadgen")
+# Modules that may import pygame, but must not open a window
+WINDOW_MODULES = ("gui",)
+# Most time importing a rules module may take, in milliseconds
+RULES_BUDGET = 30
+# Most time importing any other headless module may take, in milliseconds
+IMPORT_BUDGET = 100
+# Times each import is repeated, keeping the median
+REPEATS = 7
+
+# Run in a fresh interpreter to time one import
+PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+pygame = sys.modules.get("pygame")
+print(elapsed, pygame is not None, bool(pygame and pygame.display.get_init()))
+"""
+
+
+def time_import(module, repeats=REPEATS):
+    """Return the median import of module in ms, and what it started."""
+    times = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # pygame prints a greeting first, so the result is the last line
+        last_line = result.stdout.splitlines()[-1]
+        elapsed, uses_pygame, opens_window = last_line.split()
+        times.append(float(elapsed))
+    return (
+        statistics.median(times),
+        uses_pygame == "True",
+        opens_window == "True",
+    )
+
+
+def main(argv=None):
+    """Time every import and report any that break the rules above."""
+    parser = argparse.ArgumentParser(description="Time module imports.")
+    parser.add_argument(
+        "--rules-budget",
+        type=float,
+        default=RULES_BUDGET,
+        help="most milliseconds a rules module may take to import",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=IMPORT_BUDGET,
+        help="most milliseconds any other headless module may take",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=REPEATS,
+        help="times each import is repeated, keeping the median",
+    )
+    args = parser.parse_args(argv)
+
+    problems = []
+    for module in HEADLESS_MODULES + SERVER_MODULES + WINDOW_MODULES:
+        elapsed, uses_pygame, opens_window = time_import(module, args.repeats)
+        print(f"{module:12} {elapsed:7.1f} ms")
+        if module not in WINDOW_MODULES and uses_pygame:
+            problems.append(f"{module} imports pygame")
+        budget = args.rules_budget if module in RULES_MODULES else args.budget
+        if module in HEADLESS_MODULES and elapsed > budget:
+            problems.append(
+                f"{module} took {elapsed:.1f} ms, "
+                f"over the {budget:g} ms budget"
+            )
+        if opens_window:
+            problems.append(f"{module} starts the display when imported")
+
+    for problem in problems:
+        print("FAIL:", problem)
+    if problems:
+        sys.exit(1)
+    print("All imports are within budget.")
+
+
+if __name__ == "__main__":
+    main()
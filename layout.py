@@ -0,0 +1,82 @@
+"""
+Created by: Naysa Maria Manu.
+
+Layout of a row of cards.
+
+Works out where each card of a hand goes on screen once, when the hand
+changes, instead of for every card on every frame and every click. Cards
+sit side by side in the middle of the screen, and a hand too wide for
+the screen is fanned out so that the cards overlap and still fit. Clicks
+are matched to a card with a binary search over the cards' left edges.
+Positions are plain numbers of pixels.
+"""
+
+from bisect import bisect_right
+
+
+def row_positions(count, card_width, screen_width, spacing, margin):
+    """Return the x of each of count cards centered across the screen."""
+    step = card_width + spacing
+    if step * count > screen_width and count > 1:
+        # Fan the cards out so the whole hand fits between the margins
+        step = (screen_width - 2 * margin - card_width) // (count - 1)
+        width = step * (count - 1) + card_width
+        start = (screen_width - width) // 2
+    else:
+        start = (screen_width - step * count) // 2
+    return [start + i * step for i in range(count)]
+
+
+class RowLayout:
+    """Where each card of a row goes, worked out once for each hand."""
+
+    def __init__(self, screen_width, card_size, y, spacing, margin=10):
+        """Create a layout for cards of card_size in a row at height y."""
+        # Width of the screen the row is centered on
+        self.screen_width = screen_width
+        # Size of a single card
+        self.card_width, self.card_height = card_size
+        # Top of every card in the row
+        self.y = y
+        # Gap between cards that fit side by side
+        self.spacing = spacing
+        # Space kept at each side of a fanned out row
+        self.margin = margin
+        # Cards the positions were worked out for
+        self.cards = ()
+        # Left edge of each card, in drawing order, so in ascending order
+        self.xs = []
+
+    def update(self, cards):
+        """Work out the positions again, only if the cards have changed."""
+        cards = tuple(cards)
+        if cards != self.cards:
+            self.cards = cards
+            self.xs = row_positions(
+                len(cards),
+                self.card_width,
+                self.screen_width,
+                self.spacing,
+                self.margin,
+            )
+        return self
+
+    def positions(self):
+        """Return (card, (x, y)) for each card, in drawing order."""
+        y = self.y
+        return [
+            (card, (x, y)) for card, x in zip(self.cards, self.xs, strict=True)
+        ]
+
+    def card_at(self, x, y):
+        """Return the card drawn on top at (x, y), or None."""
+        # A card covers card_width pixels from its left edge, so its right
+        # and bottom edges are the first pixels past it, as with pygame.Rect
+        if not self.y <= y < self.y + self.card_height:
+            return None
+        # Cards drawn later cover earlier ones, so take the last one
+        # starting at or before x
+        index = bisect_right(self.xs, x) - 1
+        if index < 0 or x >= self.xs[index] + self.card_width:
+            return None
+        return self.cards[index]
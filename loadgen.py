@@ -0,0 +1,293 @@
+"""
+Created by: Naysa Maria Manu.
+
+Game server load generator.
+
+Plays games against the game server from many connections at once, each
+at its own table against a computer seat, and reports how many moves a
+second the server answered and how long moves took from being sent to
+their update arriving. It can also hold tables open where nobody moves,
+to check that idle tables don't slow the busy ones down. Unless pointed
+at a running server with --port it starts one of its own, on the same
+event loop as its clients, so the times then include the clients' work,
+and every connection needs a file for each end. Run it with
+`python loadgen.py --clients 50 --idle 1000`.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import math
+import time
+from dataclasses import dataclass, field
+
+from cards import card_matches_top_card, parse_card
+from engine import DRAW_MOVE, PLAY_MOVES
+from protocol import HOST, MAX_LINE, decode, encode, encode_move
+from server import GameServer
+from simulate import MAX_TURNS
+from sync import TableView
+
+# Move latency percentiles that are reported
+PERCENTILES = (50, 90, 99)
+# Files the process has open besides its connections, such as the
+# listening socket and the interpreter's own
+SPARE_FILES = 64
+
+
+@dataclass
+class LoadResult:
+    """Totals collected by a load run."""
+
+    # Time each move took to be answered, in seconds
+    latencies: list = field(default_factory=list)
+    # Bytes received while playing
+    received: int = 0
+    # Snapshots asked for after an update was missed
+    resyncs: int = 0
+    # Games played to the end
+    games: int = 0
+    # Tables held open without moving
+    idle: int = 0
+    # Wall clock time spent playing
+    seconds: float = 0.0
+    # The server's own stats message at the end of the run
+    server: dict = field(default_factory=dict)
+
+    def report(self):
+        """Return a printable summary of the run."""
+        moves = len(self.latencies)
+        seconds = max(self.seconds, 1e-9)
+        latencies = sorted(self.latencies)
+        lines = [
+            f"Moves: {moves}",
+            f"Moves per second: {moves / seconds:.1f}",
+            f"Bytes received per move: {self.received / max(moves, 1):.0f}",
+            f"Resyncs: {self.resyncs}",
+            f"Games finished: {self.games}",
+            f"Idle tables: {self.idle}",
+        ]
+        if latencies:
+            for percent in PERCENTILES:
+                latency = percentile(latencies, percent) * 1000
+                lines.append(f"p{percent} move latency: {latency:.2f} ms")
+            lines.append(f"Slowest move: {latencies[-1] * 1000:.2f} ms")
+        if self.server:
+            lines.append(
+                f"Server: {self.server['tables']} tables, "
+                f"{self.server['clients']} clients, "
+                f"{self.server['moves']} moves"
+            )
+        return "\n".join(lines)
+
+
+def percentile(values, percent):
+    """Return the value percent of the way through sorted values."""
+    index = max(math.ceil(len(values) * percent / 100) - 1, 0)
+    return values[index]
+
+
+def choose_move(view):
+    """Return the first playable card in the view's hand, or a draw."""
+    top_card = None if view.top is None else parse_card(view.top)
+    for name in view.hand:
+        card = parse_card(name)
+        if top_card is None or card_matches_top_card(card, top_card):
+            return PLAY_MOVES[card]
+    return DRAW_MOVE
+
+
+async def receive(reader, kind, result=None):
+    """Read messages until one of type kind arrives, and return it."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection.")
+        if result is not None:
+            result.received += len(line)
+        message = decode(line)
+        if message["type"] == "error":
+            raise RuntimeError(message["message"])
+        if message["type"] == kind:
+            return message
+
+
+async def join_table(reader, writer, ai):
+    """Join a new table against ai and return its view."""
+    writer.write(encode({"type": "join", "table": None, "ai": ai}))
+    await receive(reader, "joined")
+    return TableView((await receive(reader, "snapshot"))["view"])
+
+
+async def make_move(reader, writer, view, move, result):
+    """Send move and return the view once its update has arrived."""
+    writer.write(encode(encode_move(move)))
+    message = await receive(reader, "update", result)
+    if view.follows(message):
+        view.apply(message)
+        return view
+    # An update was missed, so start again from a snapshot
+    result.resyncs += 1
+    writer.write(encode({"type": "resync"}))
+    return TableView((await receive(reader, "snapshot", result))["view"])
+
+
+def files_needed(clients, idle, own_server):
+    """Return the open files a run needs, two a connection if serving."""
+    per_connection = 2 if own_server else 1
+    return (clients + idle + 1) * per_connection + SPARE_FILES
+
+
+def raise_file_limit(needed):
+    """Allow up to needed open files if possible, return the limit."""
+    try:
+        import resource
+    except ImportError:
+        # Windows has no such limit to raise
+        return needed
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        if hard == resource.RLIM_INFINITY or hard >= needed:
+            soft = needed
+        else:
+            soft = hard
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    return needed if soft == resource.RLIM_INFINITY else soft
+
+
+async def close_writer(writer):
+    """Close writer, ignoring a connection that has already gone."""
+    writer.close()
+    with contextlib.suppress(ConnectionError):
+        await writer.wait_closed()
+
+
+async def play_games(host, port, ai, deadline, result):
+    """Play game after game on one connection until deadline."""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    try:
+        view = await join_table(reader, writer, ai)
+        while time.perf_counter() < deadline:
+            # Start a new game once this one is won or has gone on too long
+            if view.winner is not None or view.turns >= MAX_TURNS:
+                result.games += view.winner is not None
+                view = await join_table(reader, writer, ai)
+                continue
+
+            start = time.perf_counter()
+            view = await make_move(
+                reader, writer, view, choose_move(view), result
+            )
+            result.latencies.append(time.perf_counter() - start)
+    finally:
+        await close_writer(writer)
+
+
+async def open_idle_table(host, port, ai, writers):
+    """Join a table that nobody will move at, adding its writer to writers."""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    writers.append(writer)
+    await join_table(reader, writer, ai)
+
+
+async def server_stats(host, port):
+    """Return the server's stats message."""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    try:
+        writer.write(encode({"type": "stats"}))
+        return await receive(reader, "stats")
+    finally:
+        await close_writer(writer)
+
+
+async def run_load(
+    clients, idle=0, seconds=5.0, ai="first", host=HOST, port=None
+):
+    """Play from clients connections for seconds, with idle tables open."""
+    game_server = server = None
+    if port is None:
+        # Any free port will do for a server of our own
+        game_server = GameServer()
+        server = await game_server.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    result = LoadResult(idle=idle)
+    idle_writers = []
+    try:
+        # A task group stops every other task as soon as one fails
+        async with asyncio.TaskGroup() as group:
+            for _ in range(idle):
+                group.create_task(
+                    open_idle_table(host, port, ai, idle_writers)
+                )
+        start = time.perf_counter()
+        async with asyncio.TaskGroup() as group:
+            for _ in range(clients):
+                group.create_task(
+                    play_games(host, port, ai, start + seconds, result)
+                )
+        result.seconds = time.perf_counter() - start
+        result.server = await server_stats(host, port)
+    finally:
+        await asyncio.gather(*(close_writer(w) for w in idle_writers))
+        if server is not None:
+            await game_server.stop(server)
+    return result
+
+
+def main(argv=None):
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Measure how fast the game server answers moves."
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=50,
+        help="connections playing games at once",
+    )
+    parser.add_argument(
+        "--idle",
+        type=int,
+        default=1000,
+        help="tables held open without moving",
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=5.0, help="time to play for"
+    )
+    parser.add_argument(
+        "--ai", default="first", help="strategy the server plays against"
+    )
+    parser.add_argument("--host", default=HOST, help="server address")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="port of a running server, instead of starting one",
+    )
+    args = parser.parse_args(argv)
+
+    needed = files_needed(args.clients, args.idle, args.port is None)
+    limit = raise_file_limit(needed)
+    if limit < needed:
+        parser.error(
+            f"{args.clients} clients and {args.idle} idle tables need about "
+            f"{needed} open files, but only {limit} are allowed. Use fewer, "
+            "or raise the limit with `ulimit -n`."
+        )
+
+    result = asyncio.run(
+        run_load(
+            args.clients,
+            args.idle,
+            args.seconds,
+            args.ai,
+            args.host,
+            args.port,
+        )
+    )
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Created by: Naysa Maria Manu.
+
+Card piles used by the rules engine.
+
+The deck is shuffled once with a seeded random number generator and then
+dealt from the end, so every draw is a constant time list pop. The
+discard pile also keeps its top card at the end, so playing a card is a
+constant time append, and its cards go back into the deck when the deck
+runs out. Hands keep their cards in buckets by color and value, so
+finding a playable card only looks at the cards that can match.
+"""
+
+from cards import CARD_COLOR, CARD_VALUE, Color, Value
+
+
+class Deck:
+    """The draw pile, shuffled up front and drawn from the end."""
+
+    def __init__(self, rng, cards=()):
+        """Create a deck holding cards, shuffled later with rng."""
+        # Random number generator, so that games can be replayed
+        self.rng = rng
+        # Cards in the deck, the next card to draw is at the end
+        self.cards = list(cards)
+
+    def __len__(self):
+        """Return the number of cards left in the deck."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Iterate over the cards left in the deck."""
+        return iter(self.cards)
+
+    def shuffle(self):
+        """Shuffle the cards left in the deck."""
+        self.rng.shuffle(self.cards)
+
+    def refill(self, cards):
+        """Add cards to the deck and shuffle it."""
+        self.cards.extend(cards)
+        self.shuffle()
+
+    def draw(self):
+        """Remove and return the next card, or None if the deck is empty."""
+        return self.cards.pop() if self.cards else None
+
+    def draw_many(self, count):
+        """Remove and return up to count cards from the deck."""
+        cards = self.cards
+        # Cards are drawn one at a time from the end, last card first
+        drawn = cards[: -count - 1 : -1] if count else []
+        del cards[len(cards) - len(drawn) :]
+        return drawn
+
+
+class DiscardPile:
+    """The pile of played cards, with the top card at the end."""
+
+    def __init__(self, cards=()):
+        """Create a discard pile holding cards, the last one on top."""
+        # Played cards, from the bottom of the pile to the top
+        self.cards = list(cards)
+
+    def __len__(self):
+        """Return the number of cards in the pile."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Iterate over the cards from the bottom of the pile to the top."""
+        return iter(self.cards)
+
+    @property
+    def top(self):
+        """The card on top of the pile, or None if it is empty."""
+        return self.cards[-1] if self.cards else None
+
+    def push(self, card):
+        """Put card on top of the pile."""
+        self.cards.append(card)
+
+    def take_all_but_top(self):
+        """Remove and return every card except the top one."""
+        cards = self.cards[:-1]
+        del self.cards[:-1]
+        return cards
+
+
+class Hand:
+    """The cards held by one seat, indexed by color and value."""
+
+    def __init__(self, cards=()):
+        """Create a hand holding cards, in the order they are given."""
+        # Each card with the order it was added in, which is display order
+        self.order = {}
+        # Number given to the next card added
+        self.next_order = 0
+        # Cards in the hand of each color and of each value
+        self.by_color = [set() for _ in Color]
+        self.by_value = [set() for _ in Value]
+        self.extend(cards)
+
+    def __len__(self):
+        """Return the number of cards in the hand."""
+        return len(self.order)
+
+    def __iter__(self):
+        """Iterate over the cards in display order."""
+        return iter(self.order)
+
+    def __contains__(self, card):
+        """Check if card is in the hand."""
+        return card in self.order
+
+    def add(self, card):
+        """Add card to the end of the hand."""
+        # A deck holds one copy of each card, so cards are never repeated
+        self.order[card] = self.next_order
+        self.next_order += 1
+        self.by_color[CARD_COLOR[card]].add(card)
+        self.by_value[CARD_VALUE[card]].add(card)
+
+    def extend(self, cards):
+        """Add each of cards to the end of the hand."""
+        for card in cards:
+            self.add(card)
+
+    def remove(self, card):
+        """Remove card from the hand."""
+        if card not in self.order:
+            raise ValueError("Card is not in the hand.")
+        del self.order[card]
+        self.by_color[CARD_COLOR[card]].discard(card)
+        self.by_value[CARD_VALUE[card]].discard(card)
+
+    def count_color(self, color):
+        """Return the number of cards of color in the hand."""
+        return len(self.by_color[color])
+
+    def has_playable(self, top_card):
+        """Check if any card in the hand can be played on top_card."""
+        return bool(
+            self.by_color[CARD_COLOR[top_card]]
+            or self.by_value[CARD_VALUE[top_card]]
+        )
+
+    def playable(self, top_card):
+        """Return the cards that can be played on top_card, in order."""
+        cards = (
+            self.by_color[CARD_COLOR[top_card]]
+            | self.by_value[CARD_VALUE[top_card]]
+        )
+        return sorted(cards, key=self.order.__getitem__)
+
+    def first_playable(self, top_card):
+        """Return the first card that can be played on top_card, or None."""
+        order = self.order
+        best = None
+        for cards in (
+            self.by_color[CARD_COLOR[top_card]],
+            self.by_value[CARD_VALUE[top_card]],
+        ):
+            for card in cards:
+                if best is None or order[card] < order[best]:
+                    best = card
+        return best
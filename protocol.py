@@ -0,0 +1,72 @@
+"""
+Created by: Naysa Maria Manu.
+
+Game server protocol.
+
+Clients talk to the game server over a plain TCP connection on
+localhost, one JSON object to a line, each with a "type" saying what it
+is. Cards are sent by name, such as "blue_7", so messages can be read
+and typed by hand. A client joins a table, then sends its moves. The
+server sends each client at the table a snapshot of what it can see
+when the game starts, then after every move an update with just what
+changed, as described in sync.py. A client that loses track asks for a
+resync and is sent a new snapshot. Nothing here opens a socket, so the
+server, the load generator and any other client share the same
+encoding.
+
+Client messages:
+    {"type": "join", "table": null, "ai": "first", "seed": null}
+    {"type": "move", "card": "blue_7"}, or "card": null to draw
+    {"type": "resync"}
+    {"type": "leave"}
+    {"type": "stats"}
+
+Server messages:
+    {"type": "joined", "table": 1, "seat": 0}
+    {"type": "snapshot", "view": {...}}
+    {"type": "update", "version": 12, "deltas": [...], "deck": 30}
+    {"type": "left"}
+    {"type": "stats", "tables": 1, "clients": 1, "moves": 0}
+    {"type": "error", "message": "..."}
+"""
+
+import json
+
+from cards import card_name, parse_card
+from engine import DRAW_MOVE, PLAY_MOVES
+
+# Where the server listens unless told otherwise
+HOST = "127.0.0.1"
+PORT = 8765
+# Longest line either side will read, in bytes
+MAX_LINE = 64 * 1024
+
+
+def encode(message):
+    """Return message as one line of JSON, ready to send."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def decode(line):
+    """Return the message sent as line, raising ValueError if it isn't one."""
+    message = json.loads(line)
+    if not isinstance(message, dict) or "type" not in message:
+        raise ValueError("A message must be an object with a type.")
+    return message
+
+
+def encode_move(move):
+    """Return the move message for move."""
+    card = None if move.card is None else card_name(move.card)
+    return {"type": "move", "card": card}
+
+
+def decode_move(message):
+    """Return the move sent in a move message."""
+    name = message.get("card")
+    if name is None:
+        return DRAW_MOVE
+    try:
+        return PLAY_MOVES[parse_card(name)]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown card: {name!r}") from None
@@ -0,0 +1,122 @@
+"""
+Created by: Naysa Maria Manu.
+
+Dirty rectangle renderer.
+
+Screens describe each frame as a background plus a list of surfaces and
+where they go. The renderer remembers the last frame it drew, works out
+which rectangles differ, such as a card that was raised, a new discard
+or a message, and redraws and pushes only those parts of the window with
+pygame.display.update.
+
+Layers that rarely change, such as a row of cards or the buttons over
+the background, are drawn once onto a single surface of their own and
+only drawn again when what they show changes, so a frame is a few large
+copies instead of many small ones.
+"""
+
+import pygame
+
+
+def merge_rects(rects):
+    """Return rects with every group of overlapping rects joined into one."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # Keep joining until rect overlaps nothing already merged
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def composite(background, items, area=None):
+    """Return items drawn over the part of background they cover."""
+    if area is None:
+        rects = [
+            surface.get_rect(topleft=position) for surface, position in items
+        ]
+        area = rects[0].unionall(rects[1:])
+    area = pygame.Rect(area).clip(background.get_rect())
+    # Start from the background, so the layer can be copied without alpha
+    surface = background.subsurface(area).copy()
+    for image, (x, y) in items:
+        surface.blit(image, (x - area.x, y - area.y))
+    return surface, area.topleft
+
+
+class Layer:
+    """Items drawn onto one surface, drawn again only when they change."""
+
+    def __init__(self):
+        """Create a layer that has not been drawn yet."""
+        # What the layer was last drawn for, matching no key at first
+        self.key = object()
+        # The drawn layer as (surface, position), or None if it is empty
+        self.sprite = None
+
+    def get(self, key, background, build, area=None):
+        """Return the layer for key, drawing build() over background if new."""
+        if key != self.key:
+            items = build()
+            self.sprite = (
+                composite(background, items, area) if items or area else None
+            )
+            self.key = key
+        return self.sprite
+
+
+class Renderer:
+    """Draws frames to the window, redrawing only what changed."""
+
+    def __init__(self, screen):
+        """Create a renderer that draws to screen."""
+        # The window surface
+        self.screen = screen
+        # Background of the last frame
+        self.background = None
+        # Surfaces of the last frame, as (surface, rect) in drawing order
+        self.items = []
+        # Whether the next frame must be drawn in full
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Draw the whole of the next frame, after others drew to screen."""
+        self.full_redraw = True
+
+    def draw(self, background, items):
+        """Draw (surface, position) items over background."""
+        items = [
+            (surface, surface.get_rect(topleft=position))
+            for surface, position in items
+        ]
+        screen = self.screen
+
+        if self.full_redraw or background is not self.background:
+            # Nothing on screen can be kept, so draw everything
+            screen.blit(background, (0, 0))
+            for surface, rect in items:
+                screen.blit(surface, rect)
+            pygame.display.flip()
+            dirty = [screen.get_rect()]
+        else:
+            # Anything that appeared, moved or went away must be redrawn
+            old = {(surface, tuple(rect)) for surface, rect in self.items}
+            new = {(surface, tuple(rect)) for surface, rect in items}
+            dirty = merge_rects(rect for _, rect in old ^ new)
+            for area in dirty:
+                screen.set_clip(area)
+                screen.blit(background, area, area)
+                for surface, rect in items:
+                    if rect.colliderect(area):
+                        screen.blit(surface, rect)
+            screen.set_clip(None)
+            if dirty:
+                pygame.display.update(dirty)
+
+        self.background = background
+        self.items = items
+        self.full_redraw = False
+        return dirty
@@ -0,0 +1,87 @@
+"""
+Created by: Naysa Maria Manu.
+
+Scene stack.
+
+Each screen of the game, such as the home screen, the instructions, the
+table and the end of a game, is a scene with hooks for input, for time
+passing and for drawing. Scenes are kept on a stack and only the top one
+runs, so a screen shown over another, like the instructions, is pushed
+and then popped to go back. One loop runs every scene a frame at a time,
+so the frame rate cap and the timing below apply to every screen alike.
+"""
+
+import time
+
+
+class Scene:
+    """One screen of the game, run by a SceneManager."""
+
+    def handle_event(self, event, now):
+        """Respond to one input event."""
+
+    def update(self, now):
+        """Move the scene on to time now, in milliseconds."""
+
+    def render(self):
+        """Draw the scene."""
+
+    def time_until_update(self, now):
+        """Return milliseconds until the scene changes by itself, or None."""
+
+
+class SceneManager:
+    """A stack of scenes, running the one on top."""
+
+    def __init__(self):
+        """Create an empty stack."""
+        # Scenes from the bottom of the stack to the top
+        self.stack = []
+        # Frames run, and the time they spent working, in milliseconds
+        self.frames = 0
+        self.busy_ms = 0.0
+        # Longest a single frame worked, in milliseconds
+        self.slowest_ms = 0.0
+
+    @property
+    def top(self):
+        """The scene that is running."""
+        return self.stack[-1]
+
+    def push(self, scene):
+        """Run scene over the current one until it is popped."""
+        self.stack.append(scene)
+
+    def pop(self):
+        """Stop the top scene and go back to the one under it."""
+        return self.stack.pop()
+
+    def replace(self, scene):
+        """Run scene instead of the whole stack."""
+        self.stack = [scene]
+
+    def time_until_update(self, now):
+        """Return milliseconds until the top scene changes, or None."""
+        return self.top.time_until_update(now)
+
+    def run_frame(self, events, now):
+        """Pass events to the top scene, then update and draw it."""
+        started = time.perf_counter()
+        for event in events:
+            # A scene can hand over to another part way through the events
+            self.top.handle_event(event, now)
+        self.top.update(now)
+        self.top.render()
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self.frames += 1
+        self.busy_ms += elapsed
+        self.slowest_ms = max(self.slowest_ms, elapsed)
+
+    def stats(self):
+        """Return a printable summary of the time frames spent working."""
+        average = self.busy_ms / self.frames if self.frames else 0.0
+        return (
+            f"{self.frames} frames, {average:.2f} ms average, "
+            f"{self.slowest_ms:.2f} ms slowest"
+        )
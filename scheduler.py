@@ -0,0 +1,68 @@
+"""
+Created by: Naysa Maria Manu.
+
+Turn scheduler.
+
+Runs the turns of a game in a plain loop. The engine decides whose turn
+is next from the direction of play and any skips, and the scheduler keeps
+moving computer seats until the game ends or a seat moved by a person is
+up. Every move, whoever made it, goes through the scheduler, so listeners
+see each turn as it happens and the stack never grows with the game.
+"""
+
+
+class TurnScheduler:
+    """Advances a game turn by turn for the seats it controls."""
+
+    def __init__(self, state, strategies):
+        """Schedule state, using strategies[seat] to move each seat."""
+        # The game being played
+        self.state = state
+        # Strategy for each seat, None for seats moved by a person
+        self.strategies = list(strategies)
+        # Functions called with (seat, events) after every move
+        self.listeners = []
+        # Number of moves made so far
+        self.moves = 0
+
+    def add_listener(self, listener):
+        """Call listener with (seat, events) after every move."""
+        self.listeners.append(listener)
+
+    def computer_to_move(self):
+        """Check if the game is running and a computer seat is up."""
+        state = self.state
+        return not state.is_over and self.strategies[state.current] is not None
+
+    def apply(self, move):
+        """Apply a move for the current seat and tell the listeners."""
+        seat = self.state.current
+        return self._notify(seat, self.state.apply(move))
+
+    def pass_turn(self):
+        """End the current seat's turn and tell the listeners."""
+        seat = self.state.current
+        return self._notify(seat, self.state.pass_turn())
+
+    def step(self):
+        """Make one move for the computer seat that is up."""
+        state = self.state
+        seat = state.current
+        events = state.apply(self.strategies[seat](state))
+        return self._notify(seat, events)
+
+    def run(self, max_turns=None):
+        """Move computer seats until a person is up or the game ends."""
+        state = self.state
+        while self.computer_to_move():
+            if max_turns is not None and state.turns >= max_turns:
+                break
+            self.step()
+        return state
+
+    def _notify(self, seat, events):
+        """Count a move and pass its events to every listener."""
+        self.moves += 1
+        for listener in self.listeners:
+            listener(seat, events)
+        return events
@@ -0,0 +1,393 @@
+"""
+Created by: Naysa Maria Manu.
+
+Monte Carlo search computer player.
+
+A seat can't see the other hands or the order of the deck, so the search
+deals the cards it can't see at random, many times over, and plays each
+move it could make to the end of the game on those deals with a fast
+rollout strategy. The move that wins the largest share of its rollouts
+is played. The search runs for a set time for each move, or for a set
+number of deals so that results can be replayed, and can spread its
+rollouts over a pool of worker processes.
+
+Each move is valued from the top card, the card it plays, how many
+other cards of that color the seat keeps and how many cards every seat
+holds alone, with the rest of the seat's hand dealt at random along with
+the hidden cards. Hand sizes are put into buckets, and
+the rules treat the four colors alike, so colors are renamed into a set
+order first. Many moves in many games then share one value, which is
+searched once, seeded from the move itself, and kept in a cache. Values
+only depend on the move, so reusing them never changes how a game plays
+out, whichever games were played before it.
+
+Run `python search.py` to measure how many rollouts a second it plays.
+"""
+
+import argparse
+import bisect
+import os
+import random
+import time
+from dataclasses import dataclass
+
+from cache import LRUCache
+from cards import (
+    CARD_COLOR,
+    CARD_COLORS,
+    CARD_VALUE,
+    NUM_CARD_CODES,
+    Color,
+    make_card,
+)
+from engine import (
+    DRAW_MOVE,
+    NUM_SEATS,
+    PLAY,
+    PLAY_MOVES,
+    GameState,
+    first_playable_card,
+    new_deck,
+)
+from piles import Deck, DiscardPile, Hand
+
+# Time the search may take for each move, in milliseconds
+BUDGET_MS = 50
+# Rollouts still running after this many turns count as half a win
+ROLLOUT_MAX_TURNS = 300
+# Move values kept, so that a move seen again isn't searched
+CACHE_SIZE = 50000
+# The smallest hand size in each bucket, which hands are searched as.
+# Small hands are kept apart, as they are close to winning
+SIZE_BUCKETS = (0, 1, 2, 3, 4, 6, 9)
+# Cards of the played color kept in hand beyond this are searched as if
+# there were this many
+KEPT_LIMIT = 3
+# Bits used in a move key by each card, by each hand size and by the
+# cards kept
+CARD_BITS = NUM_CARD_CODES.bit_length()
+SIZE_BITS = SIZE_BUCKETS[-1].bit_length()
+KEPT_BITS = KEPT_LIMIT.bit_length()
+
+
+def rename(card, colors):
+    """Return card with its color changed to colors[color]."""
+    return make_card(colors[CARD_COLOR[card]], CARD_VALUE[card])
+
+
+def size_bucket(size):
+    """Return the size hands of size cards are searched as."""
+    return SIZE_BUCKETS[bisect.bisect_right(SIZE_BUCKETS, size) - 1]
+
+
+def searched_colors(top_card, card):
+    """Return the color each color is searched as, indexed by color."""
+    # The rules treat every color alike, so the top card's color is
+    # searched as the first color and the played card's as the next
+    known = [CARD_COLOR[held] for held in (top_card, card) if held is not None]
+    order = sorted(
+        CARD_COLORS,
+        key=lambda color: known.index(color) if color in known else 2,
+    )
+    colors = list(Color)
+    for searched, color in zip(CARD_COLORS, order, strict=True):
+        colors[color] = searched
+    return colors
+
+
+@dataclass(frozen=True)
+class Situation:
+    """What a move is valued from, with colors renamed."""
+
+    # The card on top of the discard pile, or None
+    top_card: int | None
+    # The card the move plays
+    card: int
+    # Size bucket of each hand, the seat to move first, then in the order
+    # the others play after it
+    hand_sizes: tuple
+    # Other cards of the played card's color the seat keeps, up to
+    # KEPT_LIMIT, as they decide what it can play next
+    kept: int
+
+    @property
+    def key(self):
+        """A compact int that is different for every situation."""
+        # The top card, the card played, the cards kept, then hand sizes
+        top_card = NUM_CARD_CODES if self.top_card is None else self.top_card
+        key = (top_card << CARD_BITS | self.card) << KEPT_BITS | self.kept
+        for size in self.hand_sizes:
+            key = key << SIZE_BITS | size
+        return key
+
+
+def find_situation(state, card):
+    """Return the Situation of the current seat playing card."""
+    seat = state.current
+    top_card = state.top_card
+    colors = searched_colors(top_card, card)
+    # With two seats the direction of play never matters, so only the
+    # sizes of the hands are kept, in the order they play
+    hand_sizes = tuple(
+        size_bucket(len(state.hands[(seat + offset) % NUM_SEATS]))
+        for offset in range(NUM_SEATS)
+    )
+    # The card played is counted in its color, but isn't kept
+    color = CARD_COLOR[card]
+    kept = sum(CARD_COLOR[held] == color for held in state.hands[seat]) - 1
+    return Situation(
+        None if top_card is None else rename(top_card, colors),
+        rename(card, colors),
+        hand_sizes,
+        min(kept, KEPT_LIMIT, hand_sizes[0] - 1),
+    )
+
+
+def searched_moves(state):
+    """Return the moves worth searching for the current seat."""
+    # Drawing while holding a playable card only adds a card to the hand,
+    # and rollouts are too noisy to reliably tell that it is worse
+    moves = [move for move in state.legal_moves() if move.kind == PLAY]
+    return moves or [DRAW_MOVE]
+
+
+def determinize(situation, rng):
+    """Return a game from situation, with every unseen card dealt at random."""
+    # The seat to move is seat 0 and the others follow it in order. Every
+    # card but the top card and the one being played could be anywhere,
+    # including the rest of the seat's own hand
+    game = GameState(rng)
+    top_card = situation.top_card
+    card = situation.card
+    game.discard_pile = DiscardPile(() if top_card is None else [top_card])
+    hidden = new_deck()
+    hidden.remove(card)
+    if top_card is not None:
+        hidden.remove(top_card)
+    rng.shuffle(hidden)
+
+    # The seat holds the card it plays, the cards it keeps of that color,
+    # and any other cards to make up its hand size
+    same = [held for held in hidden if CARD_COLOR[held] == CARD_COLOR[card]]
+    other = [held for held in hidden if CARD_COLOR[held] != CARD_COLOR[card]]
+    kept = situation.kept
+    count = max(situation.hand_sizes[0] - 1 - kept, 0)
+    game.hands[0] = Hand([card, *same[:kept], *other[:count]])
+    hidden = same[kept:] + other[count:]
+    rng.shuffle(hidden)
+    for seat, count in enumerate(situation.hand_sizes[1:], 1):
+        game.hands[seat] = Hand(hidden[len(hidden) - count :])
+        del hidden[len(hidden) - count :]
+    game.deck = Deck(rng, hidden)
+    return game
+
+
+def rollout(game, strategy=first_playable_card, max_turns=ROLLOUT_MAX_TURNS):
+    """Play game to the end with strategy for every seat, return the winner."""
+    while not game.is_over and game.turns < max_turns:
+        game.apply(strategy(game))
+    return game.winner
+
+
+def search_situation(
+    situation,
+    seed,
+    deals=None,
+    budget_ms=None,
+    strategy=first_playable_card,
+    max_turns=ROLLOUT_MAX_TURNS,
+):
+    """Play situation's move out on random deals, return (wins, deals)."""
+    # A set number of deals always wins over the clock, so that the result
+    # never depends on how busy the machine is
+    if deals is None and budget_ms is None:
+        raise ValueError("Either deals or budget_ms must be given.")
+    rng = random.Random(seed)
+    deadline = None
+    if deals is None:
+        deadline = time.perf_counter() + budget_ms / 1000
+    move = PLAY_MOVES[situation.card]
+    wins = 0.0
+    played = 0
+
+    while deals is None or played < deals:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        game = determinize(situation, random.Random(rng.getrandbits(64)))
+        game.apply(move)
+        winner = rollout(game, strategy, max_turns)
+        if winner == 0:
+            wins += 1
+        elif winner is None:
+            wins += 0.5
+        played += 1
+    return wins, played
+
+
+class MonteCarloSearch:
+    """A strategy that plays the move winning the most random rollouts."""
+
+    def __init__(
+        self,
+        budget_ms=BUDGET_MS,
+        deals=None,
+        workers=0,
+        strategy=first_playable_card,
+        max_turns=ROLLOUT_MAX_TURNS,
+        cache_size=CACHE_SIZE,
+    ):
+        """Search for budget_ms, or for deals deals, on workers processes."""
+        # Time allowed for each move, only used when deals is None
+        self.budget_ms = budget_ms
+        # Deals tried for each move, so that results can be replayed
+        self.deals = deals
+        # Worker processes, 0 to search in the calling thread
+        self.workers = workers
+        # Strategy every seat uses in the rollouts
+        self.strategy = strategy
+        # Turns after which a rollout is stopped
+        self.max_turns = max_turns
+        # Fraction of rollouts won by each move searched, by situation key
+        self.cache = LRUCache(cache_size)
+        # Worker pool, started on the first search that needs it
+        self.executor = None
+        # Totals over every search, for reporting
+        self.searches = 0
+        self.rollouts = 0
+
+    def __call__(self, state):
+        """Return the move to make, as any strategy does."""
+        return self.choose(state)
+
+    def choose(self, state):
+        """Return the move that won the most rollouts."""
+        moves = searched_moves(state)
+        # With nothing to choose between there is nothing to search
+        if len(moves) == 1:
+            return moves[0]
+        return max(moves, key=lambda move: self.value(state, move))
+
+    def value(self, state, move):
+        """Return the fraction of rollouts move wins, searching if needed."""
+        situation = find_situation(state, move.card)
+        return self.cache.get(situation.key, lambda: self.search(situation))
+
+    def search(self, situation):
+        """Value a situation that isn't in the cache."""
+        wins, deals = self.evaluate(situation)
+        self.searches += 1
+        self.rollouts += deals
+        return wins / max(deals, 1)
+
+    def evaluate(self, situation):
+        """Return the wins of situation's move and the deals tried."""
+        # The seed comes from the situation, so the same situation is
+        # always searched on the same deals, and a seeded game replays
+        # exactly whatever was searched before it
+        seed = situation.key
+        if not self.workers:
+            return search_situation(
+                situation,
+                seed,
+                self.deals,
+                self.budget_ms,
+                self.strategy,
+                self.max_turns,
+            )
+
+        if self.executor is None:
+            # Imported here, as the pool is slow to import and most
+            # searches never use it
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        # Each worker searches its own deals and the wins are added up
+        deals = self.deals
+        futures = [
+            self.executor.submit(
+                search_situation,
+                situation,
+                seed + worker,
+                None if deals is None else -(-deals // self.workers),
+                self.budget_ms,
+                self.strategy,
+                self.max_turns,
+            )
+            for worker in range(self.workers)
+        ]
+        wins = 0.0
+        played = 0
+        for future in futures:
+            worker_wins, worker_deals = future.result()
+            wins += worker_wins
+            played += worker_deals
+        return wins, played
+
+    def close(self):
+        """Stop the worker processes, if any were started."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def benchmark(seconds, workers=0, seed=0):
+    """Return rollouts played a second by a search running for seconds."""
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal()
+    # Deal again until the seat to move has a card to play
+    while (move := searched_moves(game)[0]).kind != PLAY:
+        game.shuffle_and_deal()
+    situation = find_situation(game, move.card)
+    player = MonteCarloSearch(budget_ms=seconds * 1000, workers=workers)
+    try:
+        # Warm the pool up first, so starting it isn't timed
+        if workers:
+            player.budget_ms = 1
+            player.evaluate(situation)
+            player.budget_ms = seconds * 1000
+        start = time.perf_counter()
+        _, deals = player.evaluate(situation)
+        elapsed = time.perf_counter() - start
+    finally:
+        player.close()
+    return deals / elapsed
+
+
+def main(argv=None):
+    """Measure rollouts a second from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Measure how fast the Monte Carlo search plays rollouts."
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=2.0,
+        help="time to search for",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes, 0 to search in this process",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, metavar="S", help="game seed"
+    )
+    args = parser.parse_args(argv)
+
+    single = benchmark(args.seconds, 0, args.seed)
+    print(f"Rollouts per second, 1 process: {single:.0f}")
+    if args.workers:
+        pooled = benchmark(args.seconds, args.workers, args.seed)
+        print(
+            f"Rollouts per second, {args.workers} workers: {pooled:.0f} "
+            f"({pooled / single:.1f}x)"
+        )
+    print(
+        f"Rollouts per {BUDGET_MS} ms move: "
+        f"{single * BUDGET_MS / 1000:.0f} in 1 process"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Created by: Naysa Maria Manu.
+
+Search replay check.
+
+The search strategy plays a set number of deals for each move, so that
+a seeded game plays out the same way every time. Plays a few seeded
+games with the search given plenty of time and again with almost none.
+Then plays a small tournament including the search on one worker and
+on several, in small chunks so the search cache is reused between
+games. Exits with an error if any move or total differs, so a search
+that starts depending on the clock or on its cache is noticed straight
+away.
+"""
+
+import argparse
+import random
+import sys
+
+from engine import NUM_SEATS, GameState, first_playable_card
+from scheduler import TurnScheduler
+from search import MonteCarloSearch
+from strategies import SEARCH_DEALS
+from tournament import run_tournament
+
+# Seeds played by default
+SEEDS = 3
+# Time given to the search for each move, in milliseconds
+SLOW_BUDGET_MS = 10000
+FAST_BUDGET_MS = 0.001
+# Workers the tournament is compared across, and seeds given to each
+TOURNAMENT_WORKERS = (1, 3)
+TOURNAMENT_CHUNK_SIZE = 2
+
+
+def play_recorded(seed, search):
+    """Play seed with search against first, return every event."""
+    events = []
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal(seed % NUM_SEATS)
+    scheduler = TurnScheduler(game, [search, first_playable_card])
+    scheduler.add_listener(lambda seat, moved: events.extend(moved))
+    scheduler.run(max_turns=1000)
+    return events
+
+
+def check_replay(seeds):
+    """Return a problem for each seed that plays out differently."""
+    problems = []
+    for seed in range(seeds):
+        slow = play_recorded(
+            seed, MonteCarloSearch(SLOW_BUDGET_MS, deals=SEARCH_DEALS)
+        )
+        fast = play_recorded(
+            seed, MonteCarloSearch(FAST_BUDGET_MS, deals=SEARCH_DEALS)
+        )
+        if slow != fast:
+            problems.append(f"seed {seed} changes with the time budget")
+    return problems
+
+
+def check_tournament(seeds):
+    """Return a problem if the tournament totals change with the workers."""
+    totals = []
+    for workers in TOURNAMENT_WORKERS:
+        results = run_tournament(
+            ["first", "search"],
+            seeds,
+            workers=workers,
+            chunk_size=TOURNAMENT_CHUNK_SIZE,
+        )
+        # Cache hits may change with the workers, the games must not
+        totals.append(
+            {
+                pair: (result.games, result.wins, result.turns)
+                for pair, result in results.items()
+            }
+        )
+    if any(total != totals[0] for total in totals):
+        return ["tournament totals change with the number of workers"]
+    return []
+
+
+def main(argv=None):
+    """Run every check and report any that fail."""
+    parser = argparse.ArgumentParser(description="Check search replays.")
+    parser.add_argument(
+        "--seeds", type=int, default=SEEDS, help="number of games to play"
+    )
+    args = parser.parse_args(argv)
+
+    problems = check_replay(args.seeds) + check_tournament(args.seeds * 2)
+    for problem in problems:
+        print("FAIL:", problem)
+    if problems:
+        sys.exit(1)
+    print("Seeded games and tournaments with the search replay exactly.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Created by: Naysa Maria Manu.
+
+Multi-table game server.
+
+Hosts many UNO tables from one process with asyncio. Each client holds
+one TCP connection and sits at one table; seats nobody joined are played
+by a computer strategy. A table is only game state: it has no thread or
+task of its own and never waits. When a move arrives the rules engine
+applies it, the computer seats answer, and every client at the table is
+sent what changed, so a table nobody is moving at costs nothing but its
+memory. Quick strategies answer straight away; slow ones, such as the
+search, work out their moves on a worker thread, so the event loop keeps
+serving every other table in the meantime. Any program that speaks the
+protocol in protocol.py can play, and the rules it runs are the same
+ones the pygame window uses. Run it with `python main.py --serve`, and
+measure it with `python loadgen.py`.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from engine import NUM_SEATS, GameState
+from protocol import (
+    HOST,
+    MAX_LINE,
+    PORT,
+    decode,
+    decode_move,
+    encode,
+)
+from scheduler import TurnScheduler
+from strategies import SLOW_STRATEGIES, STRATEGIES
+from sync import snapshot, update
+
+
+class Table:
+    """One game, with the clients sitting at it."""
+
+    def __init__(self, table_id, strategies, seed=None, executor=None):
+        """Create a table using strategies[seat], None for client seats."""
+        # Number clients use to join this table
+        self.id = table_id
+        # The game, and the scheduler moving its computer seats
+        self.state = GameState(random.Random(seed))
+        self.scheduler = TurnScheduler(self.state, strategies)
+        self.scheduler.add_listener(self.record)
+        # Client sitting in each seat, by seat
+        self.clients = {}
+        # Events not yet sent to the clients
+        self.events = []
+        # Whether the cards have been dealt
+        self.started = False
+        # Works out the computer's moves off the event loop, or None to
+        # work them out straight away
+        self.executor = executor
+
+    def free_seat(self):
+        """Return a seat waiting for a client, or None if there isn't one."""
+        for seat, strategy in enumerate(self.scheduler.strategies):
+            if strategy is None and seat not in self.clients:
+                return seat
+        return None
+
+    def record(self, seat, events):
+        """Keep the events of a move until they are sent."""
+        self.events.extend(events)
+
+    async def start(self):
+        """Deal the cards, let any computer seat that is first move."""
+        self.state.shuffle_and_deal()
+        self.started = True
+        await self.run_computer()
+        # Everyone starts from a snapshot, which includes these moves
+        self.events = []
+        for client in self.clients.values():
+            self.send_snapshot(client)
+
+    async def play(self, seat, move):
+        """Make move for seat, then every computer move that follows."""
+        state = self.state
+        if not self.started:
+            raise ValueError("The game hasn't started yet.")
+        if state.is_over:
+            raise ValueError("The game is already over.")
+        if state.current != seat:
+            raise ValueError("It isn't your turn.")
+        self.scheduler.apply(move)
+        await self.run_computer()
+
+    async def run_computer(self):
+        """Move computer seats until a client is up or the game ends."""
+        scheduler = self.scheduler
+        if self.executor is None:
+            scheduler.run()
+            return
+        loop = asyncio.get_running_loop()
+        # Only the client that moved waits for these, and nobody else can
+        # move until a client is up, so the state isn't changed meanwhile
+        while scheduler.computer_to_move():
+            strategy = scheduler.strategies[self.state.current]
+            move = await loop.run_in_executor(
+                self.executor, strategy, self.state
+            )
+            scheduler.apply(move)
+
+    def send_updates(self):
+        """Send every client what changed since the last update."""
+        events = self.events
+        self.events = []
+        for seat, client in self.clients.items():
+            client.send(update(self.state, events, seat))
+
+    def send_snapshot(self, client):
+        """Send client everything its seat can see."""
+        client.send(
+            {"type": "snapshot", "view": snapshot(self.state, client.seat)}
+        )
+
+
+class Client:
+    """One connection, and the seat it has at a table."""
+
+    def __init__(self, writer):
+        """Create a client that sends its messages to writer."""
+        # Where messages to the client are written
+        self.writer = writer
+        # The table and seat the client has joined, if any
+        self.table = None
+        self.seat = None
+
+    def send(self, message):
+        """Queue message to be sent to the client."""
+        self.writer.write(encode(message))
+
+
+class GameServer:
+    """Runs every table and answers every client."""
+
+    def __init__(self, seed=None):
+        """Create a server with no tables."""
+        # Tables by number
+        self.tables = {}
+        # Number given to the next table
+        self.next_table = 1
+        # Gives each new table its seed, when the server is seeded
+        self.rng = None if seed is None else random.Random(seed)
+        # Thread slow strategies work out their moves on. One is enough, as
+        # a strategy holds Python's lock while it thinks, and it keeps each
+        # strategy's caches to a single thread
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        # Tasks answering each open connection, so they can be stopped
+        self.handlers = set()
+        # Totals for reporting
+        self.connections = 0
+        self.moves = 0
+
+    async def handle_client(self, reader, writer):
+        """Answer one connection's messages until it closes."""
+        client = Client(writer)
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        self.connections += 1
+        try:
+            while line := await reader.readline():
+                try:
+                    await self.handle_message(client, decode(line))
+                except ValueError as error:
+                    client.send({"type": "error", "message": str(error)})
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            # The client went away, sent a line that was too long, or the
+            # server is stopping
+            pass
+        finally:
+            self.handlers.discard(task)
+            self.connections -= 1
+            self.leave(client)
+            writer.close()
+
+    async def handle_message(self, client, message):
+        """Act on one message from client."""
+        kind = message["type"]
+        if kind == "join":
+            await self.join(client, message)
+        elif kind == "move":
+            if client.table is None:
+                raise ValueError("Join a table first.")
+            await client.table.play(client.seat, decode_move(message))
+            self.moves += 1
+            client.table.send_updates()
+        elif kind == "resync":
+            if client.table is None:
+                raise ValueError("Join a table first.")
+            client.table.send_snapshot(client)
+        elif kind == "leave":
+            self.leave(client)
+            client.send({"type": "left"})
+        elif kind == "stats":
+            client.send(self.stats())
+        else:
+            raise ValueError(f"Unknown message type: {kind!r}")
+
+    async def join(self, client, message):
+        """Sit client at the table it asked for, or at a new one."""
+        table_id = message.get("table")
+        if table_id is None:
+            table = self.new_table(message.get("ai"), message.get("seed"))
+        elif not isinstance(table_id, int):
+            raise ValueError(f"There is no table {table_id!r}.")
+        else:
+            table = self.tables.get(table_id)
+            if table is None:
+                raise ValueError(f"There is no table {table_id!r}.")
+            if table is client.table:
+                raise ValueError("You are already at this table.")
+        seat = table.free_seat()
+        if seat is None:
+            raise ValueError(f"Table {table.id} is full.")
+
+        self.leave(client)
+        client.table = table
+        client.seat = seat
+        table.clients[seat] = client
+        client.send({"type": "joined", "table": table.id, "seat": seat})
+        if table.started:
+            # Someone is taking over a seat that was left
+            table.send_snapshot(client)
+        elif table.free_seat() is None:
+            # The game starts once every seat is taken
+            await table.start()
+
+    def new_table(self, ai, seed=None):
+        """Create a table with the computer playing ai, if given."""
+        if ai is not None and (
+            not isinstance(ai, str) or ai not in STRATEGIES
+        ):
+            raise ValueError(f"Unknown strategy: {ai!r}")
+        if seed is not None and not isinstance(seed, int):
+            raise ValueError(f"A seed must be a whole number, not {seed!r}.")
+        strategies = [None] * NUM_SEATS
+        if ai is not None:
+            # The client sits first, the computer plays every other seat
+            strategies[1:] = [STRATEGIES[ai]] * (NUM_SEATS - 1)
+        if seed is None and self.rng is not None:
+            seed = self.rng.getrandbits(64)
+        # Slow strategies think on the worker thread, others on the loop
+        executor = self.executor if ai in SLOW_STRATEGIES else None
+        table = Table(self.next_table, strategies, seed, executor)
+        self.tables[table.id] = table
+        self.next_table += 1
+        return table
+
+    def leave(self, client):
+        """Take client away from its table, closing the table once empty."""
+        table = client.table
+        if table is None:
+            return
+        del table.clients[client.seat]
+        client.table = None
+        client.seat = None
+        if not table.clients:
+            del self.tables[table.id]
+
+    def stats(self):
+        """Return the stats message."""
+        return {
+            "type": "stats",
+            "tables": len(self.tables),
+            "clients": self.connections,
+            "moves": self.moves,
+        }
+
+    async def start(self, host=HOST, port=PORT):
+        """Start listening, and return the asyncio server."""
+        return await asyncio.start_server(
+            self.handle_client, host, port, limit=MAX_LINE
+        )
+
+    async def stop(self, server):
+        """Stop listening on server and end every open connection."""
+        server.close()
+        handlers = list(self.handlers)
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await server.wait_closed()
+
+
+async def serve(host, port, seed=None):
+    """Run a server until the process is stopped."""
+    server = await GameServer(seed).start(host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving UNO tables on {address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Run the server from the command line."""
+    parser = argparse.ArgumentParser(description="Host UNO tables.")
+    parser.add_argument(
+        "--serve", action="store_true", help="run the game server"
+    )
+    parser.add_argument("--host", default=HOST, help="address to listen on")
+    parser.add_argument(
+        "--port", type=int, default=PORT, help="port to listen on"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        metavar="S",
+        help="seed for the deals, so that tables replay",
+    )
+    args = parser.parse_args(argv)
+    # Stopping the server with Ctrl+C isn't an error
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.seed))
+
+
+if __name__ == "__main__":
+    main()
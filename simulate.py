@@ -0,0 +1,110 @@
+"""
+Created by: Naysa Maria Manu.
+
+Self-play simulator.
+
+Plays many UNO games between computer players with no display and no
+waits, then reports how fast the games ran, how long they lasted and who
+won them. Run it with `python main.py --simulate N --seed S`.
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+
+from engine import NUM_SEATS, GameState, first_playable_card
+from scheduler import TurnScheduler
+
+# Games still running after this many turns are stopped and not counted
+MAX_TURNS = 1000
+
+
+@dataclass
+class SimulationResult:
+    """Totals collected over a batch of simulated games."""
+
+    # Number of games played
+    games: int = 0
+    # Games won by each seat
+    wins: list = field(default_factory=lambda: [0] * NUM_SEATS)
+    # Games stopped at MAX_TURNS without a winner
+    unfinished: int = 0
+    # Turns played over all games
+    turns: int = 0
+    # Wall clock time spent playing
+    seconds: float = 0.0
+
+    def add_game(self, game):
+        """Add the outcome of a finished game to the totals."""
+        self.games += 1
+        self.turns += game.turns
+        if game.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[game.winner] += 1
+
+    def report(self):
+        """Return a printable summary of the results."""
+        games = max(self.games, 1)
+        seconds = max(self.seconds, 1e-9)
+        lines = [
+            f"Games played: {self.games}",
+            f"Games per second: {self.games / seconds:.1f}",
+            f"Average turns: {self.turns / games:.1f}",
+        ]
+        for seat, wins in enumerate(self.wins):
+            lines.append(f"Seat {seat} win rate: {wins / games:.2%}")
+        lines.append(f"Unfinished games: {self.unfinished}")
+        return "\n".join(lines)
+
+
+def play_one_game(seed, strategies, first=0, max_turns=MAX_TURNS):
+    """Play one game with a strategy per seat and return the final state."""
+    game = GameState(random.Random(seed))
+    game.shuffle_and_deal(first)
+    return TurnScheduler(game, strategies).run(max_turns)
+
+
+def simulate(num_games, seed=0, strategies=None, max_turns=MAX_TURNS):
+    """Play num_games games, game i using seed + i, and total the results."""
+    if strategies is None:
+        strategies = [first_playable_card] * NUM_SEATS
+
+    result = SimulationResult()
+    start = time.perf_counter()
+    for i in range(num_games):
+        # Take turns at going first so neither seat gets an advantage
+        game = play_one_game(seed + i, strategies, i % NUM_SEATS, max_turns)
+        result.add_game(game)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main(argv=None):
+    """Run the simulator from the command line."""
+    parser = argparse.ArgumentParser(description="Simulate UNO games.")
+    parser.add_argument(
+        "--simulate",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="number of games to play",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, metavar="S", help="first game seed"
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=MAX_TURNS,
+        help="turns after which a game is stopped",
+    )
+    args = parser.parse_args(argv)
+
+    result = simulate(args.simulate, args.seed, max_turns=args.max_turns)
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Created by: Naysa Maria Manu.
+
+Computer player strategies.
+
+A strategy is a function that takes a GameState and returns the Move the
+current seat should make. Strategies are looked up by name in STRATEGIES
+so that they can be chosen from the command line and sent to worker
+processes.
+"""
+
+from cards import CARD_COLOR, CARD_VALUE, Value
+from engine import DRAW_MOVE, PLAY, first_playable_card
+from search import MonteCarloSearch
+
+# Values that hurt the other seat or keep the turn
+ACTION_VALUES = frozenset(
+    (Value.DRAW_FOUR, Value.DRAW_TWO, Value.SKIP, Value.REVERSE)
+)
+# Deals the search tries for each move. A set number rather than a time
+# budget keeps tournaments and seeded games replayable
+SEARCH_DEALS = 16
+# Strategies that take many milliseconds a move, too slow to play
+# thousands of games with or to run where they would hold up other tables
+SLOW_STRATEGIES = frozenset(("search",))
+
+
+def playable_moves(state):
+    """Return only the moves that play a card."""
+    return [move for move in state.legal_moves() if move.kind == PLAY]
+
+
+def random_playable_card(state):
+    """Pick any playable card at random, or draw if there is none."""
+    moves = playable_moves(state)
+    if not moves:
+        return DRAW_MOVE
+    return state.rng.choice(moves)
+
+
+def action_cards_first(state):
+    """Play +2, skip and reverse cards before number cards."""
+    moves = playable_moves(state)
+    if not moves:
+        return DRAW_MOVE
+    for move in moves:
+        if CARD_VALUE[move.card] in ACTION_VALUES:
+            return move
+    return moves[0]
+
+
+def most_common_color(state):
+    """Play a card of the color held most, to keep later plays open."""
+    moves = playable_moves(state)
+    if not moves:
+        return DRAW_MOVE
+    hand = state.hands[state.current]
+    return max(moves, key=lambda move: hand.count_color(CARD_COLOR[move.card]))
+
+
+# Every strategy by the name used on the command line
+STRATEGIES = {
+    "first": first_playable_card,
+    "random": random_playable_card,
+    "action": action_cards_first,
+    "color": most_common_color,
+    "search": MonteCarloSearch(budget_ms=None, deals=SEARCH_DEALS),
+}
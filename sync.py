@@ -0,0 +1,134 @@
+"""
+Created by: Naysa Maria Manu.
+
+State sync.
+
+Keeps a client's picture of a table up to date without sending it the
+whole table after every move. A client is sent a snapshot of what its
+seat can see when it joins, after each new deal, and when it asks to
+resync. After that it is only sent deltas: one short list for each event
+the engine reports, such as a card played, cards drawn, the direction
+changing or the turn moving on. Each seat only sees its own cards, so
+another seat's draw is sent as a number of cards. The engine numbers its
+events, so every update says which version the table is at, and a view
+that missed a delta knows to ask for a snapshot instead of going wrong.
+The work and the bytes for an update depend only on what happened, not
+on how many cards anybody holds.
+
+Deltas, by event:
+    ["play", seat, card]
+    ["draw", seat, [card, ...]], or ["draw", seat, count] for others
+    ["reverse", seat]
+    ["skip", seat]
+    ["turn", seat]
+    ["win", seat]
+"""
+
+from cards import card_name
+from engine import NUM_SEATS
+
+
+def snapshot(state, seat):
+    """Return everything seat can see of the table."""
+    top_card = state.top_card
+    return {
+        "version": state.version,
+        "seat": seat,
+        # Only the seat's own cards are shown, the others are counted
+        "hand": [card_name(card) for card in state.hands[seat]],
+        "hand_sizes": [len(state.hands[other]) for other in range(NUM_SEATS)],
+        "top": None if top_card is None else card_name(top_card),
+        "deck": len(state.deck),
+        "current": state.current,
+        "direction": state.direction,
+        "winner": state.winner,
+        "turns": state.turns,
+    }
+
+
+def delta(event, viewer):
+    """Return event as the seat viewer may see it."""
+    if event.kind == "play":
+        return [event.kind, event.seat, card_name(event.cards[0])]
+    if event.kind == "draw":
+        if event.seat != viewer:
+            return [event.kind, event.seat, len(event.cards)]
+        return [event.kind, event.seat, [card_name(c) for c in event.cards]]
+    return [event.kind, event.seat]
+
+
+def update(state, events, viewer):
+    """Return the update message for events, as viewer may see them."""
+    return {
+        "type": "update",
+        "version": state.version,
+        "deltas": [delta(event, viewer) for event in events],
+        # Sent whole, as the deck can be refilled from the discard pile
+        "deck": len(state.deck),
+    }
+
+
+class TableView:
+    """A client's picture of a table, kept up to date by updates."""
+
+    def __init__(self, snapshot):
+        """Create a view from a snapshot."""
+        # Version of the table the view is up to date with
+        self.version = snapshot["version"]
+        # Seat the view is for
+        self.seat = snapshot["seat"]
+        # The seat's own cards, by name, in the order they were drawn
+        self.hand = list(snapshot["hand"])
+        # Number of cards held by each seat
+        self.hand_sizes = list(snapshot["hand_sizes"])
+        # Name of the card on the discard pile, and cards left to draw
+        self.top = snapshot["top"]
+        self.deck = snapshot["deck"]
+        # Seat to move, direction of play, winner and turns played
+        self.current = snapshot["current"]
+        self.direction = snapshot["direction"]
+        self.winner = snapshot["winner"]
+        self.turns = snapshot["turns"]
+
+    def follows(self, message):
+        """Check if the update message carries on from this view."""
+        return message["version"] - len(message["deltas"]) == self.version
+
+    def apply(self, message):
+        """Apply an update message, returning the names of what changed."""
+        # Names of the attributes that changed, so a renderer only needs
+        # to redraw those parts of the table
+        changed = set()
+        for kind, seat, *rest in message["deltas"]:
+            if kind == "play":
+                card = rest[0]
+                if seat == self.seat:
+                    self.hand.remove(card)
+                    changed.add("hand")
+                self.hand_sizes[seat] -= 1
+                self.top = card
+                changed.update(("hand_sizes", "top"))
+            elif kind == "draw":
+                drawn = rest[0]
+                if seat == self.seat:
+                    self.hand.extend(drawn)
+                    changed.add("hand")
+                    drawn = len(drawn)
+                self.hand_sizes[seat] += drawn
+                changed.add("hand_sizes")
+            elif kind == "reverse":
+                self.direction = -self.direction
+                changed.add("direction")
+            elif kind == "turn":
+                self.current = seat
+                self.turns += 1
+                changed.update(("current", "turns"))
+            elif kind == "win":
+                self.winner = seat
+                self.turns += 1
+                changed.update(("winner", "turns"))
+        if message["deck"] != self.deck:
+            self.deck = message["deck"]
+            changed.add("deck")
+        self.version = message["version"]
+        return changed
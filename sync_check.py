@@ -0,0 +1,128 @@
+"""
+Created by: Naysa Maria Manu.
+
+Table sync check.
+
+Starts a game server and plays games against it from one connection,
+keeping a TableView up to date from the server's deltas. After every
+move it asks for a fresh snapshot and checks that the view matches it.
+Then makes the view miss an update and checks that it notices and
+starts again from a snapshot. Exits with an error if any view differs,
+so a delta that loses or leaks part of the table is noticed straight
+away.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from loadgen import (
+    LoadResult,
+    choose_move,
+    join_table,
+    make_move,
+    receive,
+)
+from protocol import HOST, MAX_LINE, encode
+from server import GameServer
+from simulate import MAX_TURNS
+from strategies import SLOW_STRATEGIES, STRATEGIES
+from sync import TableView
+
+# Games played against each strategy by default
+GAMES = 5
+# Seed for the server's deals, so that a failure can be replayed
+SEED = 3
+
+
+def differences(view, other):
+    """Return the names of the attributes where two views differ."""
+    names = []
+    for name, value in vars(view).items():
+        other_value = getattr(other, name)
+        if name == "hand":
+            # A hand is the same whatever order its cards are in
+            value, other_value = sorted(value), sorted(other_value)
+        if value != other_value:
+            names.append(name)
+    return names
+
+
+async def check_games(reader, writer, games):
+    """Return a problem for each move that leaves the view out of date."""
+    problems = []
+    result = LoadResult()
+    strategies = sorted(STRATEGIES.keys() - SLOW_STRATEGIES)
+    for ai in strategies * games:
+        view = await join_table(reader, writer, ai)
+        while view.winner is None and view.turns < MAX_TURNS:
+            view = await make_move(
+                reader, writer, view, choose_move(view), result
+            )
+            writer.write(encode({"type": "resync"}))
+            fresh = TableView((await receive(reader, "snapshot"))["view"])
+            if names := differences(view, fresh):
+                problems.append(
+                    f"against {ai} on turn {view.turns}, the view's "
+                    f"{', '.join(names)} differ from a snapshot"
+                )
+                break
+    if result.resyncs:
+        problems.append(f"{result.resyncs} updates were missed")
+    return problems
+
+
+async def check_missed_update(reader, writer):
+    """Return a problem if a view doesn't resync after a missed update."""
+    result = LoadResult()
+    view = await join_table(reader, writer, "first")
+    # Pretend the view is one event behind the table
+    view.version -= 1
+    view = await make_move(reader, writer, view, choose_move(view), result)
+    writer.write(encode({"type": "resync"}))
+    fresh = TableView((await receive(reader, "snapshot"))["view"])
+    if result.resyncs != 1:
+        return ["a missed update wasn't noticed"]
+    if differences(view, fresh):
+        return ["the view is wrong after resyncing"]
+    return []
+
+
+async def run_checks(games):
+    """Start a server, run every check against it, and return problems."""
+    game_server = GameServer(SEED)
+    # Any free port will do
+    server = await game_server.start(HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection(HOST, port, limit=MAX_LINE)
+    try:
+        problems = await check_games(reader, writer, games)
+        problems += await check_missed_update(reader, writer)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        await game_server.stop(server)
+    return problems
+
+
+def main(argv=None):
+    """Run every check and report any that fail."""
+    parser = argparse.ArgumentParser(description="Check table syncing.")
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=GAMES,
+        help="games to play against each strategy",
+    )
+    args = parser.parse_args(argv)
+
+    problems = asyncio.run(run_checks(args.games))
+    for problem in problems:
+        print("FAIL:", problem)
+    if problems:
+        sys.exit(1)
+    print("Views kept up to date by deltas match the server's snapshots.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Created by: Naysa Maria Manu.
+
+Timers and timed messages.
+
+Lets the game wait without blocking the main loop. Callbacks and messages
+are given a time to run or to stay on screen, and the main loop calls
+update() with the current time on every frame, so the window keeps
+drawing and handling events while it waits. All times are in
+milliseconds and are passed in by the caller.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Pacing:
+    """How long the game pauses so a person can follow it."""
+
+    # Time the computer thinks before each move
+    ai_delay: int = 2000
+    # Time a clicked card stays raised before it is played
+    play_delay: int = 100
+    # Multiplier for the time each message is shown
+    message_scale: float = 1.0
+    # Multiplier for the time cards take to move, 0 for no animations
+    animation_scale: float = 1.0
+
+    def scaled(self, factor):
+        """Return this pacing with every pause multiplied by factor."""
+        return Pacing(
+            int(self.ai_delay * factor),
+            int(self.play_delay * factor),
+            self.message_scale * factor,
+            self.animation_scale * factor,
+        )
+
+
+class TimerQueue:
+    """Callbacks waiting to be run at a later time."""
+
+    def __init__(self):
+        """Create an empty queue."""
+        # Heap of (due time, order added, callback)
+        self.heap = []
+        # Number of callbacks scheduled so far, to keep their order
+        self.count = 0
+
+    def __len__(self):
+        """Return the number of callbacks still waiting."""
+        return len(self.heap)
+
+    def schedule(self, now, delay, callback):
+        """Run callback once delay milliseconds have passed since now."""
+        heapq.heappush(self.heap, (now + delay, self.count, callback))
+        self.count += 1
+
+    def next_due(self):
+        """Return when the next callback is due, or None."""
+        return self.heap[0][0] if self.heap else None
+
+    def update(self, now):
+        """Run every callback that is due by now."""
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            _, _, callback = heapq.heappop(heap)
+            callback()
+
+    def clear(self):
+        """Forget every waiting callback."""
+        self.heap.clear()
+
+
+class MessageQueue:
+    """Messages shown one after another, each for a set time."""
+
+    def __init__(self, scale=1.0):
+        """Create an empty queue, multiplying durations by scale."""
+        # Multiplier for the time each message is shown
+        self.scale = scale
+        # Messages waiting to be shown, as (text, duration)
+        self.waiting = deque()
+        # Message on screen now, or None
+        self.current = None
+        # Time the current message comes off the screen
+        self.ends_at = 0
+
+    def show(self, text, duration):
+        """Queue text to be shown for duration milliseconds."""
+        duration = int(duration * self.scale)
+        if duration > 0:
+            self.waiting.append((text, duration))
+
+    def is_idle(self):
+        """Check if no message is on screen or waiting."""
+        return self.current is None and not self.waiting
+
+    def next_change(self):
+        """Return when the current message comes off screen, or None."""
+        return self.ends_at if self.current is not None else None
+
+    def update(self, now):
+        """Move on to the next message once the current one is done."""
+        if self.current is not None and now >= self.ends_at:
+            self.current = None
+        if self.current is None and self.waiting:
+            self.current, duration = self.waiting.popleft()
+            self.ends_at = now + duration
+
+    def clear(self):
+        """Take every message off the screen."""
+        self.waiting.clear()
+        self.current = None
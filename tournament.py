@@ -0,0 +1,196 @@
+"""
+Created by: Naysa Maria Manu.
+
+Multi-core strategy tournament.
+
+Plays every pair of strategies against each other over a range of seeds,
+spread across all cores with a process pool. Each seed is played twice,
+once with each strategy in each seat, so luck of the deal cancels out.
+Results only depend on the seeds, never on how many workers were used.
+Run it with `python main.py --tournament N --strategies first color`.
+"""
+
+import argparse
+import itertools
+import os
+import time
+from dataclasses import dataclass, field
+
+from engine import NUM_SEATS
+from simulate import MAX_TURNS, play_one_game
+from strategies import SLOW_STRATEGIES, STRATEGIES
+
+# Seeds given to a worker at a time
+CHUNK_SIZE = 500
+
+
+@dataclass
+class MatchResult:
+    """Totals for one pair of strategies."""
+
+    # Games played
+    games: int = 0
+    # Games won by each strategy, keyed by name
+    wins: dict = field(default_factory=dict)
+    # Games stopped at the turn limit without a winner
+    unfinished: int = 0
+    # Turns played over all games
+    turns: int = 0
+    # Lookups in the strategies' search caches that found a result, and
+    # lookups that had to search
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def merge(self, other):
+        """Add the totals of another result for the same pair."""
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turns += other.turns
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        for name, wins in other.wins.items():
+            self.wins[name] = self.wins.get(name, 0) + wins
+
+
+def play_match_chunk(pair, first_seed, count, max_turns=MAX_TURNS):
+    """Play seeds first_seed to first_seed + count - 1 for one pair."""
+    result = MatchResult(wins=dict.fromkeys(pair, 0))
+    # Search caches are kept between chunks, so only this chunk's use of
+    # them is counted
+    caches = [
+        STRATEGIES[name].cache
+        for name in pair
+        if hasattr(STRATEGIES[name], "cache")
+    ]
+    result.cache_hits -= sum(cache.hits for cache in caches)
+    result.cache_misses -= sum(cache.misses for cache in caches)
+    for seed in range(first_seed, first_seed + count):
+        # Play the same deal with the strategies in both seats
+        for seats in (pair, pair[::-1]):
+            seat_strategies = [STRATEGIES[name] for name in seats]
+            game = play_one_game(
+                seed, seat_strategies, seed % NUM_SEATS, max_turns
+            )
+            result.games += 1
+            result.turns += game.turns
+            if game.winner is None:
+                result.unfinished += 1
+            else:
+                result.wins[seats[game.winner]] += 1
+    result.cache_hits += sum(cache.hits for cache in caches)
+    result.cache_misses += sum(cache.misses for cache in caches)
+    return pair, result
+
+
+def run_tournament(
+    names,
+    num_seeds,
+    seed=0,
+    workers=None,
+    max_turns=MAX_TURNS,
+    chunk_size=CHUNK_SIZE,
+):
+    """Play every pair of strategies in names over num_seeds seeds."""
+    pairs = list(itertools.combinations(names, 2))
+    results = {
+        pair: MatchResult(wins=dict.fromkeys(pair, 0)) for pair in pairs
+    }
+
+    # Split every pair's seeds into chunks, one task per chunk
+    tasks = []
+    for pair in pairs:
+        for first in range(seed, seed + num_seeds, chunk_size):
+            count = min(chunk_size, seed + num_seeds - first)
+            tasks.append((pair, first, count))
+
+    # Imported here, as the pool is slow to import and importing the
+    # module to read MatchResult or STRATEGIES never needs it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(play_match_chunk, *task, max_turns)
+            for task in tasks
+        ]
+        # Addition is order independent, so totals match for any workers
+        for future in futures:
+            pair, chunk = future.result()
+            results[pair].merge(chunk)
+    return results
+
+
+def report(results, seconds):
+    """Return a printable summary of the tournament."""
+    games = sum(result.games for result in results.values())
+    lines = [
+        f"Games played: {games}",
+        f"Games per second: {games / max(seconds, 1e-9):.1f}",
+    ]
+    for pair, result in results.items():
+        played = max(result.games, 1)
+        scores = ", ".join(
+            f"{name} {result.wins[name] / played:.2%}" for name in pair
+        )
+        lines.append(
+            f"{pair[0]} vs {pair[1]}: {scores}, "
+            f"unfinished {result.unfinished}, "
+            f"average turns {result.turns / played:.1f}"
+        )
+        lookups = result.cache_hits + result.cache_misses
+        if lookups:
+            lines.append(
+                f"  search cache: {result.cache_hits} of {lookups} "
+                f"moves found ({result.cache_hits / lookups:.1%})"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run a tournament from the command line."""
+    parser = argparse.ArgumentParser(description="Compare UNO strategies.")
+    parser.add_argument(
+        "--tournament",
+        type=int,
+        default=10000,
+        metavar="N",
+        help="number of seeds to play for each pair of strategies",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, metavar="S", help="first game seed"
+    )
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        choices=sorted(STRATEGIES),
+        default=sorted(STRATEGIES.keys() - SLOW_STRATEGIES),
+        help="strategies to compare, all but search unless given",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes",
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=MAX_TURNS,
+        help="turns after which a game is stopped",
+    )
+    args = parser.parse_args(argv)
+    if len(args.strategies) < 2:
+        parser.error("at least two strategies are needed")
+
+    start = time.perf_counter()
+    results = run_tournament(
+        args.strategies,
+        args.tournament,
+        args.seed,
+        args.workers,
+        args.max_turns,
+    )
+    print(report(results, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
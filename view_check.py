@@ -0,0 +1,206 @@
+"""
+Created by: Naysa Maria Manu.
+
+Window logic check.
+
+The parts of the window that work on plain numbers are checked here
+without pygame. Lays out rows of every size, fanned out or not, and
+clicks every pixel across each row to check that each card is found on
+the strip of it that is showing and nowhere else. Then checks the order
+the cache drops entries in, the order timers and messages come due in,
+and that the animator steps and skips ahead by whole steps. Exits with
+an error if anything differs, so an off by one error is noticed
+straight away.
+"""
+
+import argparse
+import sys
+
+from animation import Animator
+from cache import LRUCache
+from layout import RowLayout
+from timers import MessageQueue, TimerQueue
+
+# Most cards laid out in a row by default
+MAX_CARDS = 40
+# Screen widths rows are laid out on
+SCREEN_WIDTHS = (800, 1280)
+# Size of every card, gap between cards and height of the row
+CARD_SIZE = (80, 120)
+SPACING = 10
+ROW_Y = 400
+
+
+def visible_strips(layout):
+    """Return the (first x, last x) of each card that is showing."""
+    xs = layout.xs
+    width = layout.card_width
+    strips = []
+    for index, x in enumerate(xs):
+        # A card is covered from where the next one starts
+        end = x + width
+        if index + 1 < len(xs):
+            end = min(end, xs[index + 1])
+        strips.append((x, end - 1))
+    return strips
+
+
+def check_rows(max_cards):
+    """Return a problem for any click that finds the wrong card."""
+    problems = []
+    middle = ROW_Y + CARD_SIZE[1] // 2
+    for screen_width in SCREEN_WIDTHS:
+        layout = RowLayout(screen_width, CARD_SIZE, ROW_Y, SPACING)
+        for count in range(1, max_cards + 1):
+            layout.update(range(count))
+            if layout.xs[0] < 0 or layout.xs[-1] + CARD_SIZE[0] > screen_width:
+                problems.append(
+                    f"{count} cards run off a {screen_width} screen"
+                )
+            # What a click on every pixel across the row should find
+            expected = {}
+            for card, (first, last) in enumerate(visible_strips(layout)):
+                for x in range(first, last + 1):
+                    expected[x] = card
+            for x in range(-1, screen_width + 1):
+                found = layout.card_at(x, middle)
+                if found != expected.get(x):
+                    problems.append(
+                        f"with {count} cards on a {screen_width} screen, "
+                        f"x {x} finds card {found}, not {expected.get(x)}"
+                    )
+                    break
+            # Just above and below the row there is nothing to click
+            x = layout.xs[0]
+            if layout.card_at(x, ROW_Y - 1) is not None or (
+                layout.card_at(x, ROW_Y + CARD_SIZE[1]) is not None
+            ):
+                problems.append(f"a click outside {count} cards finds one")
+    return problems
+
+
+def check_cache():
+    """Return a problem if the cache drops the wrong entry."""
+    cache = LRUCache(maxsize=3)
+    made = []
+
+    def make(key):
+        """Return a function that makes the entry for key."""
+        return lambda: made.append(key) or key
+
+    for key in "abc":
+        cache.get(key, make(key))
+    # Using "a" again leaves "b" as the entry used longest ago
+    cache.get("a", make("a"))
+    cache.get("d", make("d"))
+    problems = []
+    if list(cache.entries) != ["c", "a", "d"]:
+        problems.append(f"the cache kept {list(cache.entries)}")
+    if made != ["a", "b", "c", "d"]:
+        problems.append("the cache made an entry it already had")
+    if (cache.hits, cache.misses) != (1, 4):
+        problems.append("the cache miscounted its hits and misses")
+    return problems
+
+
+def check_timers():
+    """Return a problem if a timer or message comes due at the wrong time."""
+    problems = []
+    timers = TimerQueue()
+    ran = []
+    timers.schedule(0, 20, lambda: ran.append("late"))
+    timers.schedule(0, 10, lambda: ran.append("first"))
+    timers.schedule(0, 10, lambda: ran.append("second"))
+    if timers.next_due() != 10:
+        problems.append("the next timer isn't the soonest")
+    timers.update(9)
+    if ran:
+        problems.append("a timer ran before it was due")
+    # Timers due at the same time run in the order they were added
+    timers.update(10)
+    if ran != ["first", "second"]:
+        problems.append(f"timers due at 10 ran as {ran}")
+    timers.update(20)
+    if ran[-1:] != ["late"] or len(timers) or timers.next_due() is not None:
+        problems.append("the last timer didn't run when it was due")
+
+    messages = MessageQueue()
+    messages.show("one", 100)
+    messages.show("two", 50)
+    messages.update(0)
+    if messages.current != "one" or messages.next_change() != 100:
+        problems.append("the first message isn't shown straight away")
+    messages.update(99)
+    if messages.current != "one":
+        problems.append("a message came off the screen early")
+    messages.update(100)
+    if messages.current != "two" or messages.next_change() != 150:
+        problems.append("the next message didn't follow the first")
+    messages.update(150)
+    if not messages.is_idle() or messages.next_change() is not None:
+        problems.append("the queue isn't idle after its last message")
+    # Messages shown for no time at all are never shown
+    muted = MessageQueue(scale=0.0)
+    muted.show("none", 100)
+    if not muted.is_idle():
+        problems.append("a muted message was queued")
+    return problems
+
+
+def check_animator():
+    """Return a problem if the animator steps by anything but whole steps."""
+    problems = []
+    animator = Animator(step=10, max_steps=3)
+    animator.update(0)
+    animator.move("card", None, (0, 0), (100, 0), 100, delay=10)
+    # Part of a step is kept for the next update
+    animator.update(15)
+    tween = animator.tweens["card"]
+    if tween.elapsed != 0 or tween.position() != (0, 0):
+        problems.append("a delayed animation moved before its delay")
+    animator.update(20)
+    if tween.elapsed != 10:
+        problems.append("the animator lost part of a step")
+    # After a slow frame only max_steps are taken and the rest skipped
+    animator.update(1000)
+    if tween.elapsed != 40 or animator.time != 1000:
+        problems.append("the animator didn't skip ahead after a slow frame")
+    animator.update(1030)
+    animator.update(1060)
+    if "card" in animator or animator.is_busy():
+        problems.append("a finished animation wasn't stopped")
+
+    # An animator that is turned off never has anything moving
+    off = Animator(enabled=False)
+    off.move("card", None, (0, 0), (100, 0), 100)
+    if off.is_busy():
+        problems.append("an animator that is off started an animation")
+    return problems
+
+
+def main(argv=None):
+    """Run every check and report any that fail."""
+    parser = argparse.ArgumentParser(description="Check the window logic.")
+    parser.add_argument(
+        "--cards",
+        type=int,
+        default=MAX_CARDS,
+        help="most cards to lay out in a row",
+    )
+    args = parser.parse_args(argv)
+
+    problems = (
+        check_rows(args.cards)
+        + check_cache()
+        + check_timers()
+        + check_animator()
+    )
+    for problem in problems:
+        print("FAIL:", problem)
+    if problems:
+        sys.exit(1)
+    print("Rows, caches, timers and animations all behave.")
+
+
+if __name__ == "__main__":
+    main()